@@ -5,20 +5,45 @@ DuggerBootTools CLI Interface
 Provides dbt-init command for bootstrapping projects with DLT DNA validation.
 """
 
+import json
+import sys
 import click
 from pathlib import Path
-from typing import Optional
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-
-from .engine import BootEngine
-from .scout import ProjectScout
-from .harvest import HarvestEngine
+from typing import TYPE_CHECKING, Any, Optional
+
+from .console import get_console
 from .exceptions import DuggerBootError
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.panel import Panel
+
+
+def _panel(body: str, *, title: str, style: str) -> "Panel":
+    """Build a bordered panel from a Rich markup string."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    return Panel(Text.from_markup(body), title=title, border_style=style)
+
+
+def _use_json(as_json: Optional[bool]) -> bool:
+    """Resolve --json/--no-json, defaulting to JSON when stdout is not a terminal."""
+    if as_json is None:
+        return not sys.stdout.isatty()
+    return as_json
+
+
+def _echo_json(data: Any) -> None:
+    """Write data to stdout as JSON without going through Rich."""
+    click.echo(json.dumps(data, default=str))
+
+
+json_option = click.option(
+    "--json/--no-json",
+    "as_json",
+    default=None,
+    help="Emit JSON instead of formatted output (default: when stdout is not a terminal)",
+)
 
 
 @click.group()
@@ -44,6 +69,7 @@ def main() -> None:
 @click.option(
     "--path",
     default=".",
+    type=click.Path(path_type=Path),
     help="Parent directory for new project",
     show_default=True,
 )
@@ -57,27 +83,24 @@ def main() -> None:
     is_flag=True,
     help="Overwrite existing files",
 )
-def init(name: str, template: str, stack: Optional[str], path: str, retrofit: bool, force: bool) -> None:
+def init(name: str, template: str, stack: Optional[str], path: Path, retrofit: bool, force: bool) -> None:
     """Initialize a new project with DLT DNA validation or retrofit existing project."""
+    console = get_console()
     try:
+        from .engine import BootEngine
+
         engine = BootEngine()
         
         if retrofit:
             # Retrofit existing project
-            project_path = Path(path) / name
+            project_path = path / name
             actions_performed = engine.retrofit_project(
                 project_path=project_path,
                 project_name=name,
                 overwrite_ide=force,
             )
             
-            console.print(
-                Panel(
-                    Text.from_markup(f"🔧 Project '{name}' retrofitted!"),
-                    title="Project Retrofitted",
-                    border_style="green",
-                )
-            )
+            console.print(_panel(f"🔧 Project '{name}' retrofitted!", title="Project Retrofitted", style="green"))
             console.print(f"📍 Location: {project_path}")
             console.print("🧬 DNA: Upgraded to DLT standards")
             console.print(f"🔧 Actions: {len(actions_performed)} components injected")
@@ -99,59 +122,39 @@ def init(name: str, template: str, stack: Optional[str], path: str, retrofit: bo
                 template = "standard"
                 console.print(f"[yellow]Auto-selected template '{template}' for Python stack[/yellow]")
             
-            parent_dir = Path(path)
             project_path = engine.bootstrap_project(
                 name=name,
                 template_type=template,
-                parent_path=parent_dir,
+                parent_path=path,
                 force=force,
             )
             
-            console.print(
-                Panel(
-                    Text.from_markup(f"✅ [bold green]Project '{name}' created successfully![/bold green]"),
-                    title="Project Created",
-                    border_style="green",
-                )
-            )
+            console.print(_panel(f"✅ [bold green]Project '{name}' created successfully![/bold green]", title="Project Created", style="green"))
         
         # Workflow hand-off
         console.print(
-            Panel(
-                Text.from_markup(
-                    f"🚀 [bold blue]Next Step:[/bold blue] Verify ecosystem standing\n\n"
-                    f"```bash\ncd {name}\ndgt status\n```\n\n"
-                    f"This command will verify the project's health and show available DGT operations."
-                ),
+            _panel(
+                f"🚀 [bold blue]Next Step:[/bold blue] Verify ecosystem standing\n\n"
+                f"```bash\ncd {name}\ndgt status\n```\n\n"
+                f"This command will verify the project's health and show available DGT operations.",
                 title="Workflow Hand-off",
-                border_style="blue",
+                style="blue",
             )
         )
         
     except DuggerBootError as e:
-        console.print(
-            Panel(
-                Text.from_markup(f"❌ [bold red]{e.message}[/bold red]"),
-                title="Operation Failed",
-                border_style="red",
-            )
-        )
+        console.print(_panel(f"❌ [bold red]{e.message}[/bold red]", title="Operation Failed", style="red"))
         raise click.ClickException(str(e))
     except Exception as e:
-        console.print(
-            Panel(
-                Text.from_markup(f"💥 Unexpected error: {e}"),
-                title="System Error",
-                border_style="red",
-            )
-        )
+        console.print(_panel(f"💥 Unexpected error: {e}", title="System Error", style="red"))
         raise click.ClickException(str(e))
 
 
 @main.command()
 @click.option(
     "--path",
-    default=lambda: str(Path.home() / "Github"),
+    default=lambda: Path.home() / "Github",
+    type=click.Path(path_type=Path),
     help="Ecosystem root directory to scan",
     show_default=True,
 )
@@ -162,6 +165,7 @@ def init(name: str, template: str, stack: Optional[str], path: str, retrofit: bo
 )
 @click.option(
     "--output-map",
+    type=click.Path(path_type=Path),
     help="Output path for ECOSYSTEM_MAP.md",
 )
 @click.option(
@@ -169,10 +173,31 @@ def init(name: str, template: str, stack: Optional[str], path: str, retrofit: bo
     is_flag=True,
     help="Inject commit.py bridge stubs into all projects",
 )
-def scout(path: str, suggest_recycle: bool, output_map: str, inject_stubs: bool) -> None:
+@json_option
+def scout(path: Path, suggest_recycle: bool, output_map: Optional[Path], inject_stubs: bool, as_json: Optional[bool]) -> None:
     """Scan ecosystem for harvestable components and retrofit candidates."""
+    if _use_json(as_json):
+        try:
+            from .scout import ProjectScout
+
+            scout = ProjectScout(path)
+            if inject_stubs:
+                _echo_json(scout.inject_commit_stubs(dry_run=False))
+                return
+            
+            # Retrofit candidates are part of the inventory, so skip the Rich suggestions
+            inventory = scout.scan_ecosystem()
+            scout.generate_ecosystem_map(inventory, output_map or Path.cwd() / "ECOSYSTEM_MAP.md")
+            _echo_json(inventory.model_dump(mode="json"))
+        except Exception as e:
+            raise click.ClickException(str(e)) from e
+        return
+    
+    console = get_console()
     try:
-        scout = ProjectScout(Path(path))
+        from .scout import ProjectScout
+
+        scout = ProjectScout(path)
         
         if inject_stubs:
             # Inject commit.py stubs
@@ -191,55 +216,33 @@ def scout(path: str, suggest_recycle: bool, output_map: str, inject_stubs: bool)
             
             return
         
-        inventory = scout.scan_ecosystem(suggest_recycle=suggest_recycle)
+        # Fold projects into running totals as they arrive rather than
+        # holding every project's inventory until the scan finishes
+        summary = scout.summarize_ecosystem(suggest_recycle=suggest_recycle)
         
         # Display summary
-        scout.display_summary(inventory)
+        scout.display_summary(summary)
         
         # Generate ecosystem map
         if output_map:
-            scout.generate_ecosystem_map(inventory, Path(output_map))
-            console.print(
-                Panel(
-                    Text.from_markup(f"📄 Ecosystem map generated: {output_map}"),
-                    title="Documentation Created",
-                    border_style="green",
-                )
-            )
+            scout.generate_ecosystem_map(summary, output_map)
+            console.print(_panel(f"📄 Ecosystem map generated: {output_map}", title="Documentation Created", style="green"))
         else:
             # Default to current directory
             default_path = Path.cwd() / "ECOSYSTEM_MAP.md"
-            scout.generate_ecosystem_map(inventory, default_path)
-            console.print(
-                Panel(
-                    Text.from_markup(f"📄 Ecosystem map generated: {default_path}"),
-                    title="Documentation Created",
-                    border_style="green",
-                )
-            )
+            scout.generate_ecosystem_map(summary, default_path)
+            console.print(_panel(f"📄 Ecosystem map generated: {default_path}", title="Documentation Created", style="green"))
         
     except DuggerBootError as e:
-        console.print(
-            Panel(
-                Text.from_markup(f"❌ [bold red]{e.message}[/bold red]"),
-                title="Scout Failed",
-                border_style="red",
-            )
-        )
+        console.print(_panel(f"❌ [bold red]{e.message}[/bold red]", title="Scout Failed", style="red"))
         raise click.ClickException(str(e))
     except Exception as e:
-        console.print(
-            Panel(
-                Text.from_markup(f"💥 Unexpected error: {e}"),
-                title="System Error",
-                border_style="red",
-            )
-        )
+        console.print(_panel(f"💥 Unexpected error: {e}", title="System Error", style="red"))
         raise click.ClickException(str(e))
 
 
 @main.command()
-@click.argument("source_path", type=click.Path(exists=True))
+@click.argument("source_path", type=click.Path(exists=True, path_type=Path))
 @click.option(
     "--name",
     help="Component name (auto-generated if not provided)",
@@ -257,18 +260,20 @@ def scout(path: str, suggest_recycle: bool, output_map: str, inject_stubs: bool)
     is_flag=True,
     help="Overwrite existing component",
 )
-def harvest(source_path: str, name: Optional[str], component_type: Optional[str], description: Optional[str], force: bool) -> None:
+def harvest(source_path: Path, name: Optional[str], component_type: Optional[str], description: Optional[str], force: bool) -> None:
     """Harvest a component from an existing project."""
+    console = get_console()
     try:
+        from .harvest import HarvestEngine
+
         harvest_engine = HarvestEngine()
-        source = Path(source_path)
         
         # Auto-generate name if not provided
         if name is None:
-            name = source.stem if source.is_file() else source.name
+            name = source_path.stem if source_path.is_file() else source_path.name
         
         success = harvest_engine.harvest_component(
-            source_path=source,
+            source_path=source_path,
             component_name=name,
             component_type=component_type or "shared",
             description=description,
@@ -276,39 +281,15 @@ def harvest(source_path: str, name: Optional[str], component_type: Optional[str]
         )
         
         if success:
-            console.print(
-                Panel(
-                    Text.from_markup(f"✅ [bold green]Component '{name}' harvested successfully[/bold green]"),
-                    title="Harvest Complete",
-                    border_style="green",
-                )
-            )
+            console.print(_panel(f"✅ [bold green]Component '{name}' harvested successfully[/bold green]", title="Harvest Complete", style="green"))
         else:
-            console.print(
-                Panel(
-                    Text.from_markup(f"❌ [bold red]Failed to harvest component '{name}'[/bold red]"),
-                    title="Harvest Failed",
-                    border_style="red",
-                )
-            )
+            console.print(_panel(f"❌ [bold red]Failed to harvest component '{name}'[/bold red]", title="Harvest Failed", style="red"))
             
     except DuggerBootError as e:
-        console.print(
-            Panel(
-                Text.from_markup(f"❌ [bold red]{e.message}[/bold red]"),
-                title="Harvest Failed",
-                border_style="red",
-            )
-        )
+        console.print(_panel(f"❌ [bold red]{e.message}[/bold red]", title="Harvest Failed", style="red"))
         raise click.ClickException(str(e))
     except Exception as e:
-        console.print(
-            Panel(
-                Text.from_markup(f"💥 Unexpected error: {e}"),
-                title="System Error",
-                border_style="red",
-            )
-        )
+        console.print(_panel(f"💥 Unexpected error: {e}", title="System Error", style="red"))
         raise click.ClickException(str(e))
 
 
@@ -317,9 +298,28 @@ def harvest(source_path: str, name: Optional[str], component_type: Optional[str]
     "--query",
     help="Search components by name, description, or tags",
 )
-def list_components(query: Optional[str]) -> None:
+@json_option
+def list_components(query: Optional[str], as_json: Optional[bool]) -> None:
     """List all harvested components."""
+    if _use_json(as_json):
+        try:
+            from .harvest import HarvestEngine
+
+            harvest_engine = HarvestEngine()
+            if query:
+                _echo_json(harvest_engine.search_components(query))
+            else:
+                _echo_json(harvest_engine.list_components())
+        except Exception as e:
+            raise click.ClickException(str(e)) from e
+        return
+    
+    from rich.table import Table
+
+    console = get_console()
     try:
+        from .harvest import HarvestEngine
+
         harvest_engine = HarvestEngine()
         
         if query:
@@ -352,34 +352,47 @@ def list_components(query: Optional[str]) -> None:
         console.print(table)
         
     except Exception as e:
-        console.print(
-            Panel(
-                Text.from_markup(f"💥 Unexpected error: {e}"),
-                title="System Error",
-                border_style="red",
-            )
-        )
+        console.print(_panel(f"💥 Unexpected error: {e}", title="System Error", style="red"))
         raise click.ClickException(str(e))
 
 
 @main.command()
-def list_templates() -> None:
+@json_option
+def list_templates(as_json: Optional[bool]) -> None:
     """List available project templates."""
+    if _use_json(as_json):
+        try:
+            from .engine import BootEngine
+
+            _echo_json(list(BootEngine().list_templates()))
+        except Exception as e:
+            raise click.ClickException(str(e)) from e
+        return
+    
+    from rich.panel import Panel
+
+    console = get_console()
     try:
+        from .engine import BootEngine
+
         engine = BootEngine()
-        templates = engine.list_templates()
+        any_shown = False
         
-        if not templates:
-            console.print("No templates found.")
-            return
-            
-        console.print(Panel("Available Templates", border_style="blue"))
-        for template in templates:
+        for template in engine.list_templates():
+            if not any_shown:
+                console.print(Panel("Available Templates", border_style="blue"))
+                any_shown = True
             console.print(f"  • {template}")
+        
+        if not any_shown:
+            console.print("No templates found.")
             
     except DuggerBootError as e:
         console.print(f"❌ Error listing templates: {e.message}")
         raise click.ClickException(str(e))
+    except Exception as e:
+        console.print(_panel(f"💥 Unexpected error: {e}", title="System Error", style="red"))
+        raise click.ClickException(str(e))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,23 @@
+"""
+Shared Rich console for DuggerBootTools output.
+
+Rich is imported on first use, so importing the CLI and engines (and running
+``--help`` or ``--version``) only pays for Click and the stdlib.
+"""
+
+import functools
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@functools.cache
+def get_console() -> "Console":
+    """Create the shared Rich console on first use."""
+    from rich.console import Console
+
+    # Settle colour support up front; NO_COLOR disables ANSI output entirely
+    color_system = None if os.environ.get("NO_COLOR") else "auto"
+    return Console(color_system=color_system, highlight=False)
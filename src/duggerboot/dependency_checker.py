@@ -4,39 +4,72 @@ Dependency compatibility checker for DuggerBootTools.
 Ensures template dependencies are compatible with current environment.
 """
 
-import subprocess
+import os
 import sys
+import tomllib
+from functools import cached_property, lru_cache
+from importlib.metadata import distributions
 from pathlib import Path
-from typing import Dict, List, Tuple
-from packaging import version
-from rich.console import Console
+from typing import Dict, List, Optional, Tuple
 
-console = Console()
+import orjson
+from packaging.requirements import Requirement
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+from packaging.utils import canonicalize_name
+from packaging.version import Version
+
+# Lockfiles that pin a project's resolved environment
+LOCKFILE_NAMES = ("uv.lock", "poetry.lock", "pylock.toml")
+
+# Lockfile states that passed a full check, kept across CLI runs
+VERIFIED_LOCKFILES_NAME = "verified_lockfiles.json"
+
+# Bump whenever the recorded lockfile state changes shape
+VERIFIED_LOCKFILES_VERSION = 1
+
+
+@lru_cache(maxsize=128)
+def _load_pyproject(path_str: str, mtime_ns: int) -> Dict:
+    """Parse a pyproject.toml, memoized on path and modification time."""
+    with open(path_str, "rb") as f:
+        return tomllib.load(f)
+
+
+@lru_cache(maxsize=None)
+def _spec(requirement: str) -> SpecifierSet:
+    """Parse a version specifier string, memoized across checker instances."""
+    return SpecifierSet(requirement)
 
 
 class DependencyChecker:
     """Validates dependency compatibility for templates and projects."""
     
-    def __init__(self) -> None:
+    def __init__(self, state_path: Optional[Path] = None) -> None:
+        """Initialize DependencyChecker.
+        
+        Args:
+            state_path: Verified lockfile record, defaults to
+                ~/.duggerboot/verified_lockfiles.json
+        """
         self.python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+        self._python_version = Version(self.python_version)
+        self.state_path = state_path or Path.home() / ".duggerboot" / VERIFIED_LOCKFILES_NAME
     
     def check_template_compatibility(self, template_config: Dict) -> Tuple[bool, List[str]]:
         """Check if template dependencies are compatible with current environment."""
         issues = []
+        deps = template_config.get("dependencies") or {}
         
         # Check Python version requirement
-        if "dependencies" in template_config and "python" in template_config["dependencies"]:
-            python_req = template_config["dependencies"]["python"]
-            if not self._check_python_version(python_req):
-                issues.append(f"Python version {self.python_version} does not meet requirement: {python_req}")
+        if (python_req := deps.get("python")) and not self._check_python_version(python_req):
+            issues.append(f"Python version {self.python_version} does not meet requirement: {python_req}")
         
         # Check DuggerLinkTools availability
-        if "dependencies" in template_config and "duggerlink-tools" in template_config["dependencies"]:
-            dlt_req = template_config["dependencies"]["duggerlink-tools"]
+        if dlt_req := deps.get("duggerlink-tools"):
             dlt_version = self._get_package_version("duggerlink-tools")
             if dlt_version is None:
                 issues.append("duggerlink-tools is not installed")
-            elif not self._check_version_compatibility(dlt_version, dlt_req):
+            elif not self._satisfies(dlt_version, dlt_req):
                 issues.append(f"duggerlink-tools version {dlt_version} does not meet requirement: {dlt_req}")
         
         return len(issues) == 0, issues
@@ -50,90 +83,115 @@ class DependencyChecker:
         
         # Parse pyproject.toml for dependencies
         try:
-            import tomllib
-            with open(pyproject_path, "rb") as f:
-                pyproject = tomllib.load(f)
+            pyproject_mtime = pyproject_path.stat().st_mtime_ns
+            
+            # Fast path: lockfile unchanged since it last validated cleanly in
+            # this environment, on this run or an earlier one
+            lock_state = self._find_lockfile(project_path, pyproject_mtime)
+            if lock_state is not None and self._verified_lockfiles.get(lock_state[0]) == lock_state[1]:
+                return True, []
+            
+            pyproject = _load_pyproject(str(pyproject_path), pyproject_mtime)
             
             dependencies = pyproject.get("project", {}).get("dependencies", [])
             issues = []
             
             for dep in dependencies:
-                # Parse dependency name and version requirement
-                dep_name, version_req = self._parse_dependency(dep)
-                installed_version = self._get_package_version(dep_name)
+                # Parse PEP 508 requirement once (name, extras, specifier, markers)
+                req = Requirement(dep)
+                if req.marker is not None and not req.marker.evaluate():
+                    continue
+                
+                installed_version = self._get_package_version(req.name)
                 
                 if installed_version is None:
-                    issues.append(f"Dependency {dep_name} is not installed")
-                elif version_req and not self._check_version_compatibility(installed_version, version_req):
-                    issues.append(f"Dependency {dep_name} version {installed_version} does not meet requirement: {version_req}")
+                    issues.append(f"Dependency {req.name} is not installed")
+                elif req.specifier and not req.specifier.contains(installed_version, prereleases=True):
+                    issues.append(f"Dependency {req.name} version {installed_version} does not meet requirement: {req.specifier}")
+            
+            if not issues and lock_state is not None:
+                self._record_verified(*lock_state)
             
             return len(issues) == 0, issues
             
         except Exception as e:
             return False, [f"Failed to parse dependencies: {e}"]
     
-    def _check_python_version(self, requirement: str) -> bool:
-        """Check if current Python version meets requirement."""
+    def _find_lockfile(self, project_path: Path, pyproject_mtime: int) -> Tuple[str, List] | None:
+        """Find a lockfile at least as new as pyproject.toml.
+        
+        Returns:
+            Lockfile path and its state [lockfile mtime, lockfile size,
+            pyproject mtime, environment prefix], or None
+        """
+        for lock_name in LOCKFILE_NAMES:
+            lock_path = project_path / lock_name
+            try:
+                lock_stat = lock_path.stat()
+            except OSError:
+                continue
+            if lock_stat.st_mtime_ns >= pyproject_mtime:
+                # The verdict only holds for the environment that was checked
+                return str(lock_path), [lock_stat.st_mtime_ns, lock_stat.st_size, pyproject_mtime, sys.prefix]
+        return None
+    
+    @cached_property
+    def _verified_lockfiles(self) -> Dict[str, List]:
+        """Lockfile path -> state of its last passing check, read once from disk."""
         try:
-            # Simple version comparison for >= requirements
-            if requirement.startswith(">="):
-                required_version = requirement[2:].strip()
-                return version.parse(self.python_version) >= version.parse(required_version)
-            elif requirement.startswith(">"):
-                required_version = requirement[1:].strip()
-                return version.parse(self.python_version) > version.parse(required_version)
-            elif requirement.startswith("=="):
-                required_version = requirement[2:].strip()
-                return version.parse(self.python_version) == version.parse(required_version)
-            else:
-                # Exact match
-                return self.python_version == requirement
+            data = orjson.loads(self.state_path.read_bytes())
         except Exception:
-            return False
+            return {}
+        if not isinstance(data, dict) or data.get("version") != VERIFIED_LOCKFILES_VERSION:
+            return {}
+        return data.get("lockfiles", {})
     
-    def _get_package_version(self, package_name: str) -> str | None:
-        """Get installed package version."""
+    def _record_verified(self, lock_path: str, state: List) -> None:
+        """Remember a passing lockfile state and atomically rewrite the record.
+        
+        The record only skips work, so a failed write is ignored.
+        """
+        self._verified_lockfiles[lock_path] = state
         try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "show", package_name],
-                capture_output=True,
-                text=True,
-                check=True,
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_path.with_name(f"{self.state_path.name}.tmp")
+            tmp_path.write_bytes(
+                orjson.dumps({"version": VERIFIED_LOCKFILES_VERSION, "lockfiles": self._verified_lockfiles})
             )
-            for line in result.stdout.split("\n"):
-                if line.startswith("Version:"):
-                    return line.split(":")[1].strip()
-        except subprocess.CalledProcessError:
+            os.replace(tmp_path, self.state_path)
+        except OSError:
             pass
-        return None
     
-    def _check_version_compatibility(self, installed: str, required: str) -> bool:
-        """Check if installed version meets requirement."""
+    def _check_python_version(self, requirement: str) -> bool:
+        """Check if current Python version meets requirement."""
+        return self._satisfies(self._python_version, requirement)
+    
+    @cached_property
+    def _installed(self) -> Dict[str, str]:
+        """Map of normalized distribution name to installed version.
+        
+        Built from a single scan of the environment's metadata; the first
+        distribution found on sys.path wins, matching importlib.metadata.
+        """
+        installed: Dict[str, str] = {}
+        for dist in distributions():
+            name = dist.metadata["Name"]
+            if name:
+                installed.setdefault(canonicalize_name(name), dist.version)
+        return installed
+    
+    def _get_package_version(self, package_name: str) -> str | None:
+        """Get installed package version."""
+        return self._installed.get(canonicalize_name(package_name))
+    
+    def _satisfies(self, installed: str | Version, requirement: str) -> bool:
+        """Check if installed version meets a PEP 440 specifier string."""
         try:
-            if required.startswith(">="):
-                required_version = required[2:].strip()
-                return version.parse(installed) >= version.parse(required_version)
-            elif required.startswith(">"):
-                required_version = required[1:].strip()
-                return version.parse(installed) > version.parse(required_version)
-            elif required.startswith("=="):
-                required_version = required[2:].strip()
-                return version.parse(installed) == version.parse(required_version)
-            else:
-                return installed == required
+            specifier = _spec(requirement)
+        except InvalidSpecifier:
+            # Bare version string means an exact match
+            return str(installed) == requirement.strip()
+        try:
+            return specifier.contains(installed, prereleases=True)
         except Exception:
             return False
-    
-    def _parse_dependency(self, dep: str) -> Tuple[str, str | None]:
-        """Parse dependency string into name and version requirement."""
-        if ">=" in dep:
-            parts = dep.split(">=")
-            return parts[0].strip(), f">={parts[1].strip()}"
-        elif ">" in dep:
-            parts = dep.split(">")
-            return parts[0].strip(), f">{parts[1].strip()}"
-        elif "==" in dep:
-            parts = dep.split("==")
-            return parts[0].strip(), f"=={parts[1].strip()}"
-        else:
-            return dep.strip(), None
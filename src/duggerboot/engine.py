@@ -5,19 +5,22 @@ Handles project scaffolding, template rendering, and DLT integration.
 """
 
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+import os
+import re
 import shutil
 import subprocess
 import tempfile
 import time
 from contextlib import contextmanager
-from jinja2 import Environment, FileSystemLoader, Template
 
-from duggerlink.models.project import DuggerProject as Project
-from duggerlink.retrofit_engine import RetrofitEngine
 from .exceptions import DuggerBootError
 from .dependency_checker import DependencyChecker
-from .logging_config import dugger_logger
+from .console import get_console
+from .logging_config import get_logger
+
+# Characters not allowed in project names (reserved on Windows filesystems)
+_INVALID_NAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
 
 
 class BootEngine:
@@ -28,6 +31,10 @@ class BootEngine:
         # GitOperations will be initialized per project
         self.git_manager = None
         self.dependency_checker = DependencyChecker()
+        # template_type -> (tree mtime_ns, loaded template data)
+        self._template_cache: Dict[str, tuple[int, Dict[str, Any]]] = {}
+        # (template_type, tree mtime_ns, render context) already validated
+        self._dna_validated: set[tuple[str, int, frozenset]] = set()
 
     @contextmanager
     def _atomic_bootstrap(self, project_path: Path):
@@ -73,6 +80,7 @@ class BootEngine:
         project_path = parent_path / name
         
         # Log bootstrap start
+        dugger_logger = get_logger()
         dugger_logger.log_bootstrap_start(name, template_type)
         
         try:
@@ -93,15 +101,18 @@ class BootEngine:
                 self._create_directory_structure(project_path, template_data["structure"])
                 
                 # Render and create files
-                template_path = self.templates_dir / template_type
                 context = {
                     "project_name": name,
                     "template_type": template_type,
                 }
-                self._render_files(project_path, template_path, context)
+                self._render_files(project_path, template_data, context)
                 
-                # Validate generated dugger.yaml against DLT schema
-                self._validate_dna(project_path / "dugger.yaml")
+                # Validate generated dugger.yaml against DLT schema; identical
+                # template + context renders identical output, so once is enough
+                dna_key = (template_type, self._template_cache[template_type][0], frozenset(context.items()))
+                if dna_key not in self._dna_validated:
+                    self._validate_dna(project_path / "dugger.yaml")
+                    self._dna_validated.add(dna_key)
                 
                 # Initialize Git and make initial commit
                 self._initialize_git(project_path, name)
@@ -115,12 +126,15 @@ class BootEngine:
             dugger_logger.log_bootstrap_failure(name, e)
             raise
     
-    def list_templates(self) -> List[str]:
-        """List all available project templates."""
-        if not self.templates_dir.exists():
-            return []
-        
-        return [d.name for d in self.templates_dir.iterdir() if d.is_dir()]
+    def list_templates(self) -> Iterator[str]:
+        """Yield the names of all available project templates."""
+        try:
+            with os.scandir(self.templates_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        yield entry.name
+        except FileNotFoundError:
+            return
     
     def _validate_project_name(self, name: str) -> None:
         """Validate project name meets standards."""
@@ -128,8 +142,7 @@ class BootEngine:
             raise DuggerBootError("Project name cannot be empty.")
         
         # Check for invalid characters
-        invalid_chars = set('<>:"/\\|?*')
-        if any(char in invalid_chars for char in name):
+        if _INVALID_NAME_CHARS_RE.search(name):
             raise DuggerBootError("Project name contains invalid characters.")
         
         # Check if starts with letter or underscore
@@ -137,7 +150,11 @@ class BootEngine:
             raise DuggerBootError("Project name must start with a letter or underscore.")
     
     def _load_template(self, template_type: str) -> Dict[str, Any]:
-        """Load template configuration and files."""
+        """Load template configuration and files.
+        
+        Results are cached per template type and reused until a file or
+        directory in the template tree changes.
+        """
         template_path = self.templates_dir / template_type
         
         if not template_path.exists():
@@ -151,25 +168,51 @@ class BootEngine:
         if not manifest_path.exists():
             raise DuggerBootError(f"Template '{template_type}' missing template.yaml")
         
+        file_paths, tree_mtime = self._scan_template_tree(template_path)
+        cached = self._template_cache.get(template_type)
+        if cached is not None and cached[0] == tree_mtime:
+            return cached[1]
+        
+        from jinja2 import Environment, FileSystemLoader
+        
+        env = Environment(loader=FileSystemLoader(str(template_path)))
+        
         # For now, return a basic structure
         # In a full implementation, we'd parse the YAML
-        return {
+        template_data = {
             "structure": ["src", "tests", "docs"],
-            "files": self._get_template_files(template_path),
+            # Relative path -> source file; only .j2 sources are read and compiled
+            "files": dict(file_paths),
+            "jinja_templates": {
+                rel_path: env.from_string(Path(abs_path).read_text())
+                for rel_path, abs_path in file_paths
+                if rel_path.endswith(".j2")
+            },
         }
+        self._template_cache[template_type] = (tree_mtime, template_data)
+        get_logger().log_template_load(template_type, template_path)
+        return template_data
     
-    def _get_template_files(self, template_path: Path) -> Dict[str, str]:
-        """Get all template files and their contents."""
-        files = {}
+    def _scan_template_tree(self, template_path: Path) -> tuple[List[tuple[str, str]], int]:
+        """Walk a template directory once.
+        
+        Returns:
+            (relative path, absolute path) of every template file except
+            template.yaml, and the newest mtime_ns seen in the tree
+        """
+        file_paths = []
+        tree_mtime = template_path.stat().st_mtime_ns
+        root = str(template_path)
         
-        # Walk through template directory
-        for file_path in template_path.rglob("*"):
-            if file_path.is_file() and file_path.name != "template.yaml":
-                # Get relative path from template directory
-                rel_path = file_path.relative_to(template_path)
-                files[str(rel_path)] = file_path.read_text()
+        for dir_path, _dir_names, file_names in os.walk(root):
+            tree_mtime = max(tree_mtime, os.stat(dir_path).st_mtime_ns)
+            for file_name in file_names:
+                abs_path = os.path.join(dir_path, file_name)
+                tree_mtime = max(tree_mtime, os.stat(abs_path).st_mtime_ns)
+                if file_name != "template.yaml":
+                    file_paths.append((os.path.relpath(abs_path, root), abs_path))
         
-        return files
+        return file_paths, tree_mtime
     
     def _create_directory_structure(self, project_path: Path, structure: List[str]) -> None:
         """Create the basic directory structure."""
@@ -184,49 +227,73 @@ class BootEngine:
         for dir_name in structure:
             (project_path / dir_name).mkdir(exist_ok=True)
     
-    def _render_files(self, project_path: Path, template_path: Path, context: Dict[str, Any]) -> None:
+    def _render_files(self, project_path: Path, template_data: Dict[str, Any], context: Dict[str, Any]) -> None:
         """Render template files and write to project directory."""
-        env = Environment(loader=FileSystemLoader(str(template_path)))
+        jinja_templates = template_data["jinja_templates"]
+        rendered_files: List[tuple[Path, bytes]] = []
+        copied_files: List[tuple[str, Path]] = []
         
-        # Walk through template directory
-        for file_path in template_path.rglob("*"):
-            if file_path.is_file() and file_path.name != "template.yaml":
-                # Get relative path from template directory
-                rel_path = file_path.relative_to(template_path)
-                
-                # Read template content
-                content = file_path.read_text()
-                
-                # Render content with Jinja2 if it's a template file
-                if file_path.suffix == ".j2":
-                    template = env.get_template(str(rel_path))
-                    rendered = template.render(**context)
-                    # Remove .j2 extension for output file
-                    output_path = project_path / str(rel_path)[:-3]
-                else:
-                    # Copy non-template files as-is
-                    rendered = content
-                    output_path = project_path / rel_path
-                
-                # Write to project directory
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_text(rendered, encoding='utf-8')
+        for rel_path, source_path in template_data["files"].items():
+            # Render content with Jinja2 if it's a template file
+            template = jinja_templates.get(rel_path)
+            if template is not None:
+                # Remove .j2 extension for output file
+                output_path = project_path / rel_path[:-3]
+                rendered_files.append((output_path, template.render(**context).encode("utf-8")))
+            else:
+                # Copy non-template files as-is, without a decode/encode round trip
+                copied_files.append((source_path, project_path / rel_path))
+        
+        # Create each output directory once before writing
+        output_dirs = {path.parent for path, _ in rendered_files}
+        output_dirs.update(path.parent for _, path in copied_files)
+        for output_dir in sorted(output_dirs):
+            output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Write to project directory
+        for output_path, payload in rendered_files:
+            output_path.write_bytes(payload)
+        for source_path, output_path in copied_files:
+            shutil.copyfile(source_path, output_path)
     
     def _validate_dna(self, dugger_yaml_path: Path) -> None:
         """Validate generated dugger.yaml against DLT Project schema."""
         if not dugger_yaml_path.exists():
             raise DuggerBootError("dugger.yaml was not generated.")
         
+        from duggerlink.models.project import DuggerProject as Project
+        
         try:
             # Load and validate against DLT Project model
             project_data = Project.from_file(dugger_yaml_path)
-            console.print(f"✅ DNA validation passed for {project_data.name}")
+            get_console().print(f"✅ DNA validation passed for {project_data.name}")
         except Exception as e:
             raise DuggerBootError(f"DNA validation failed: {e}")
     
     def _initialize_git(self, project_path: Path, project_name: str) -> None:
-        """Initialize Git repository and make initial commit."""
+        """Initialize Git repository and make initial commit.
+        
+        Uses pygit2 in-process when it is installed (``duggerboot-tools[git]``),
+        otherwise falls back to the git CLI.
+        """
+        commit_message = f"chore: initial bootstrap of {project_name}"
+        
         try:
+            try:
+                import pygit2
+            except ImportError:
+                pygit2 = None
+            
+            if pygit2 is not None:
+                repo = pygit2.init_repository(str(project_path))
+                repo.index.add_all()
+                repo.index.write()
+                tree = repo.index.write_tree()
+                # Identity comes from git config, as it would for `git commit`
+                signature = repo.default_signature
+                repo.create_commit("HEAD", signature, signature, commit_message, tree, [])
+                return
+            
             # Initialize git repository
             subprocess.run(
                 ["git", "init"],
@@ -244,7 +311,6 @@ class BootEngine:
             )
             
             # Make initial commit
-            commit_message = f"chore: initial bootstrap of {project_name}"
             subprocess.run(
                 ["git", "commit", "-m", commit_message],
                 cwd=project_path,
@@ -271,6 +337,8 @@ class BootEngine:
         Returns:
             Dictionary of actions performed
         """
+        from duggerlink.retrofit_engine import RetrofitEngine
+        
         try:
             retrofit_engine = RetrofitEngine(project_path)
             return retrofit_engine.retrofit_project(
@@ -280,7 +348,3 @@ class BootEngine:
         except Exception as e:
             raise DuggerBootError(f"Retrofit failed: {e}") from e
 
-
-# Import console for validation feedback
-from rich.console import Console
-console = Console()
\ No newline at end of file
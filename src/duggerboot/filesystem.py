@@ -0,0 +1,75 @@
+"""
+File system helpers shared by the harvest and scout engines.
+
+One tree walker, one set of ignored directories and one line counter, so
+harvesting and scanning agree on which files a project contains and on how
+they are measured.
+"""
+
+import os
+from pathlib import Path
+from typing import AbstractSet, BinaryIO, Iterator, Tuple
+
+# VCS metadata, virtualenvs and caches: never part of a project's content,
+# so they are left out even when copying a harvested directory verbatim
+TRANSIENT_DIRS = frozenset({
+    ".git", "__pycache__", ".venv", "venv", ".mypy_cache", ".pytest_cache", ".tox",
+})
+
+# Directories never walked for analysis: the above plus installed packages and
+# build output. Any other dot-directory is skipped as well.
+IGNORED_DIRS = TRANSIENT_DIRS | {"node_modules", "dist", "build", ".next"}
+
+# Bytes of each file read for content analysis; larger files (bundles,
+# vendored code) are only sampled from the start
+ANALYSIS_READ_LIMIT = 256 * 1024
+
+
+def walk_files(
+    root: Path | str,
+    ignored_dirs: AbstractSet[str] = IGNORED_DIRS,
+    *,
+    skip_hidden: bool = True,
+    follow_symlinks: bool = False,
+) -> Iterator[Tuple[os.DirEntry, str]]:
+    """Yield (entry, relative path) for every file under root.
+
+    Uses an explicit stack of os.scandir calls, so file type checks come from
+    the cached DirEntry data instead of an extra stat() per path. Directories
+    named in ignored_dirs (and, with skip_hidden, every dot-directory) are
+    pruned before descending, and unreadable directories are skipped.
+    Relative paths always use "/" separators.
+
+    The defaults suit project analysis. Pass TRANSIENT_DIRS,
+    skip_hidden=False and follow_symlinks=True to list exactly what a
+    harvest copies.
+    """
+    stack = [(os.fspath(root), "")]
+
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=follow_symlinks):
+                        if name not in ignored_dirs and not (skip_hidden and name.startswith(".")):
+                            stack.append((entry.path, f"{rel_dir}{name}/"))
+                    elif entry.is_file(follow_symlinks=follow_symlinks):
+                        yield entry, f"{rel_dir}{name}"
+        except OSError:
+            continue
+
+
+def count_lines(f: BinaryIO, head: bytes = b"") -> int:
+    """Count lines in head plus whatever remains unread in binary file f.
+
+    Reads the remainder in 64 KiB chunks without decoding. Matches
+    len(readlines()): a final line without a trailing newline counts.
+    """
+    newlines = head.count(b"\n")
+    last = head
+    for chunk in iter(lambda: f.read(1 << 16), b""):
+        newlines += chunk.count(b"\n")
+        last = chunk
+    return newlines + (1 if last and not last.endswith(b"\n") else 0)
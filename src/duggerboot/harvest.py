@@ -4,18 +4,107 @@ Harvest Engine - Component extraction and registration for DuggerBootTools.
 Intelligent code harvesting from existing projects for template registry population.
 """
 
-import json
+import os
+import re
 import shutil
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
+import orjson
 from loguru import logger
-from rich.console import Console
-from rich.table import Table
 
+from .console import get_console
 from .exceptions import DuggerBootError
+from .filesystem import ANALYSIS_READ_LIMIT, TRANSIENT_DIRS, count_lines, walk_files
+from .logging_config import get_logger
 
-console = Console()
+# Harvest jobs at or below this count run serially; pool startup isn't worth it
+PARALLEL_HARVEST_THRESHOLD = 4
+
+# Aggregate of every component manifest, kept at the registry root
+REGISTRY_INDEX_NAME = "registry.json"
+
+# Default file patterns harvested per category by harvest_project
+DEFAULT_HARVEST_RULES: Dict[str, List[str]] = {
+    "utils": ["utils/**/*.py", "helpers/**/*.py", "lib/**/*.py"],
+    "clients": ["*client*.py", "*api*.py"],
+    "scrapers": ["*scrape*.py", "*crawl*.py", "*spider*.py"],
+    "config": ["config*.py", "settings*.py", "*.yaml", "*.yml"],
+    "chrome": ["manifest.json", "background.js", "content.js"],
+}
+
+# Source analysis patterns. Python files are scanned once over the raw bytes,
+# prefixed with a newline so "\n" marks every line start. Each branch starts
+# with a distinct literal byte (keeping sre's fast first-byte scan) and
+# consumes only that byte, so no hit can hide another; [\w\x80-\xff] lets
+# identifiers include UTF-8 encoded letters.
+_PY_SCAN_RE = re.compile(
+    rb"\n(?=(?:import|from)\s+(?P<dependency>[\w\x80-\xff]+))"
+    rb"|d(?=ef\s+[\w\x80-\xff])"
+    rb"|c(?=lass\s+[\w\x80-\xff])"
+    rb"|#(?=\s*(?i:TODO|FIXME|NOTE))"
+)
+# Tag for each non-import hit, keyed by the byte it consumed
+_PY_SCAN_TAGS = ((b"#", "has_todos"), (b"d", "has_functions"), (b"c", "has_classes"))
+_JS_IMPORT_RE = re.compile(r"(?:import|require)\s+[\"']([^\"']+)[\"']")
+_JS_FN_RE = re.compile(r"function\s+\w+")
+
+# Word tokens indexed for component search
+_SEARCH_TOKEN_RE = re.compile(r"\w+")
+
+
+def _json_default(value: object) -> object:
+    """Serialize types orjson doesn't handle natively (sets, paths, ...)."""
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def _dump_json(data: object) -> bytes:
+    """Serialize manifest/index data as indented JSON bytes."""
+    return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
+def _ignore_transient_dirs(directory: str, names: List[str]) -> Set[str]:
+    """copytree ignore hook: skip TRANSIENT_DIRS directories, as walk_files does.
+    
+    Unlike shutil.ignore_patterns, files that happen to share one of those
+    names (a submodule's .git file, say) are still copied.
+    """
+    return {
+        name
+        for name in names
+        if name in TRANSIENT_DIRS and os.path.isdir(os.path.join(directory, name))
+    }
+
+
+def _copy_manifest(manifest: Dict) -> Dict:
+    """Copy a cached manifest, lists included, so callers can't mutate the index."""
+    return {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in manifest.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _glob_to_regex(pattern: str) -> re.Pattern[str]:
+    """Compile an rglob-style pattern into a regex over "/"-joined relative paths.
+    
+    Supports "*", "?" and "**" segments; like Path.rglob, the pattern may match
+    starting at any directory depth. Compiled patterns are cached per process.
+    """
+    parts = []
+    for segment in pattern.split("/"):
+        if segment == "**":
+            parts.append("(?:[^/]+/)*")
+        else:
+            parts.append(re.escape(segment).replace(r"\*", "[^/]*").replace(r"\?", "[^/]") + "/")
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile(rf"(?:.*/)?{''.join(parts)[:-1]}", flags)
 
 
 class HarvestEngine:
@@ -29,6 +118,20 @@ class HarvestEngine:
         """
         self.registry_path = registry_path or Path.cwd() / "components"
         self.logger = logger.bind(component="HarvestEngine")
+        # Harvest outcomes go through the shared DuggerLogger, which batches
+        # successes into one record per harvest call instead of one per component
+        self._dugger_logger = get_logger()
+        self._index_path = self.registry_path / REGISTRY_INDEX_NAME
+        # Guards the in-memory index; harvest_project saves from worker threads
+        self._index_lock = threading.RLock()
+        # (registry stamp, registry.json stat, {category: {name: manifest}})
+        self._index_cache: Optional[
+            Tuple[List[List], Optional[Tuple[int, int]], Dict[str, Dict[str, Dict]]]
+        ] = None
+        # Set when the in-memory index holds saves not yet written to registry.json
+        self._index_dirty = False
+        # (index dict, component refs in index order, {token: ref positions})
+        self._search_cache: Optional[Tuple[Dict, List[Tuple[str, Dict]], Dict[str, Set[int]]]] = None
     
     def harvest_component(
         self,
@@ -40,6 +143,38 @@ class HarvestEngine:
     ) -> bool:
         """Harvest a single component from source project.
         
+        Args:
+            source_path: Path to source file or directory
+            component_name: Name for the harvested component
+            component_type: Type of component (python, chrome, shared, etc.)
+            description: Optional description of the component
+            force: Force overwrite if component exists
+            
+        Returns:
+            True if harvest successful, False otherwise
+        """
+        # Validate the index against the registry before this harvest updates it
+        self._load_index()
+        try:
+            return self._harvest_component(
+                source_path, component_name, component_type, description, force
+            )
+        finally:
+            self._flush_index()
+            self._dugger_logger.flush()
+    
+    def _harvest_component(
+        self,
+        source_path: Path,
+        component_name: str,
+        component_type: str,
+        description: Optional[str] = None,
+        force: bool = False,
+    ) -> bool:
+        """Harvest a single component, updating the registry index in memory only.
+        
+        Callers validate the index beforehand and flush it afterwards.
+        
         Args:
             source_path: Path to source file or directory
             component_name: Name for the harvested component
@@ -72,11 +207,11 @@ class HarvestEngine:
             # Save component manifest
             self._save_component_manifest(component_dir, metadata)
             
-            self.logger.info(f"Harvested component: {component_name} ({category})")
+            self._dugger_logger.log_harvest_operation(component_name, source_path, True)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to harvest {component_name}: {e}")
+            self._dugger_logger.log_harvest_operation(component_name, source_path, False, e)
             return False
     
     def harvest_project(
@@ -99,29 +234,62 @@ class HarvestEngine:
         
         # Default harvest rules
         if harvest_rules is None:
-            harvest_rules = {
-                "utils": ["utils/**/*.py", "helpers/**/*.py", "lib/**/*.py"],
-                "clients": ["*client*.py", "*api*.py"],
-                "scrapers": ["*scrape*.py", "*crawl*.py", "*spider*.py"],
-                "config": ["config*.py", "settings*.py", "*.yaml", "*.yml"],
-                "chrome": ["manifest.json", "background.js", "content.js"],
-            }
-        
-        for category, patterns in harvest_rules.items():
-            for pattern in patterns:
-                matches = list(project_path.rglob(pattern))
-                
-                for match in matches:
-                    component_name = f"{category}_{match.stem}"
-                    success = self.harvest_component(
-                        source_path=match,
-                        component_name=component_name,
-                        component_type=category,
-                        force=force,
-                    )
-                    results[component_name] = success
-        
-        return results
+            harvest_rules = DEFAULT_HARVEST_RULES
+        
+        compiled_rules = {
+            category: [_glob_to_regex(pattern) for pattern in patterns]
+            for category, patterns in harvest_rules.items()
+        }
+        
+        # Walk the project once, testing each file against every rule, and
+        # collect matches before harvesting so registry writes can't feed the walk
+        matches = [
+            (category, Path(entry.path))
+            for entry, rel_path in walk_files(project_path)
+            for category, regexes in compiled_rules.items()
+            if any(regex.fullmatch(rel_path) for regex in regexes)
+        ]
+        
+        jobs = [(f"{category}_{match.stem}", match, category) for category, match in matches]
+        
+        def run(job: Tuple[str, Path, str]) -> bool:
+            component_name, match, category = job
+            return self._harvest_component(
+                source_path=match,
+                component_name=component_name,
+                component_type=category,
+                force=force,
+            )
+        
+        # Validate the index once, then write registry.json once for the whole batch
+        self._load_index()
+        try:
+            if len(jobs) <= PARALLEL_HARVEST_THRESHOLD:
+                for job in jobs:
+                    results[job[0]] = run(job)
+                return results
+            
+            # Harvest the first occurrence of each component name concurrently;
+            # later same-name matches target the same directory, so run them after
+            # in order, exactly as the serial loop would
+            seen: Set[str] = set()
+            first, repeats = [], []
+            for job in jobs:
+                (repeats if job[0] in seen else first).append(job)
+                seen.add(job[0])
+            
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for job, success in zip(first, executor.map(run, first)):
+                    results[job[0]] = success
+            
+            for job in repeats:
+                results[job[0]] = run(job)
+            
+            return results
+        finally:
+            self._flush_index()
+            self._dugger_logger.flush()
     
     def list_components(self) -> Dict[str, List[Dict]]:
         """List all harvested components in the registry.
@@ -129,56 +297,169 @@ class HarvestEngine:
         Returns:
             Dictionary of component categories and their components
         """
-        components = {}
+        index = self._load_index()
+        return {
+            category: [_copy_manifest(component) for component in entries.values()]
+            for category, entries in index.items()
+        }
+    
+    def get_component(self, category: str, name: str) -> Optional[Dict]:
+        """Get component metadata by category and name.
+        
+        Args:
+            category: Component category
+            name: Component name
+            
+        Returns:
+            Component metadata or None if not found
+        """
+        component = self._load_index().get(category, {}).get(name)
+        return _copy_manifest(component) if component is not None else None
+    
+    def _load_index(self) -> Dict[str, Dict[str, Dict]]:
+        """Load the registry index, rebuilding it when the registry has changed.
+        
+        Validity is checked cheaply against the category directories' mtimes,
+        which change whenever a component directory is added or removed, so
+        components arriving or leaving outside the engine (git pull, manual
+        copies) are picked up without statting every manifest. Rebuilt indexes
+        are kept in memory only; read-only commands never write to the registry.
+        
+        Returns:
+            Mapping of category to component name to manifest
+        """
+        with self._index_lock:
+            stamp = self._registry_stamp()
+            index_stat = self._index_file_stat()
+            if (
+                self._index_cache is not None
+                and self._index_cache[0] == stamp
+                # Unsaved changes are newer than registry.json; otherwise
+                # another process may have rewritten it
+                and (self._index_dirty or self._index_cache[1] == index_stat)
+            ):
+                return self._index_cache[2]
+            
+            index = None
+            if index_stat is not None:
+                try:
+                    data = orjson.loads(self._index_path.read_bytes())
+                    if data.get("stamp") == stamp:
+                        index = data["components"]
+                except Exception as e:
+                    self.logger.warning(f"Failed to load registry index, rebuilding: {e}")
+            
+            if index is None:
+                index = self._rebuild_index()
+            
+            self._index_cache = (stamp, index_stat, index)
+            return index
+    
+    def _registry_stamp(self) -> List[List]:
+        """Summarize the registry layout with one stat per category directory.
+        
+        Returns:
+            Sorted [category, mtime_ns] entries
+        """
+        stamp: List[List] = []
+        try:
+            with os.scandir(self.registry_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            stamp.append([entry.name, entry.stat().st_mtime_ns])
+                    except OSError:
+                        continue
+        except OSError:
+            return stamp
+        
+        stamp.sort()
+        return stamp
+    
+    def _index_file_stat(self) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of registry.json, or None if it is missing."""
+        try:
+            stat = os.stat(self._index_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _rebuild_index(self) -> Dict[str, Dict[str, Dict]]:
+        """Rebuild the registry index from per-component manifest files.
+        
+        Returns:
+            Mapping of category to component name to manifest
+        """
+        index: Dict[str, Dict[str, Dict]] = {}
         
         if not self.registry_path.exists():
-            return components
+            return index
         
         for category_dir in self.registry_path.iterdir():
             if not category_dir.is_dir():
                 continue
             
-            category = category_dir.name
-            components[category] = []
+            entries = index.setdefault(category_dir.name, {})
             
             for component_dir in category_dir.iterdir():
-                if not component_dir.is_dir():
-                    continue
-                
-                # Load component manifest
                 manifest_path = component_dir / "component.json"
-                if manifest_path.exists():
-                    try:
-                        with manifest_path.open("r") as f:
-                            manifest = json.load(f)
-                        components[category].append(manifest)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to load manifest for {component_dir}: {e}")
+                if not manifest_path.exists():
+                    continue
+                try:
+                    entries[component_dir.name] = orjson.loads(manifest_path.read_bytes())
+                except Exception as e:
+                    self.logger.warning(f"Failed to load manifest for {component_dir}: {e}")
         
-        return components
+        return index
     
-    def get_component(self, category: str, name: str) -> Optional[Dict]:
-        """Get component metadata by category and name.
+    def _flush_index(self) -> None:
+        """Write the in-memory index to registry.json if saves are pending.
         
-        Args:
-            category: Component category
-            name: Component name
+        The file is a cache of the manifests, so failures are logged and the
+        index is rebuilt from the manifests on a later load.
+        """
+        with self._index_lock:
+            if not self._index_dirty or self._index_cache is None:
+                return
+            
+            stamp, _, index = self._index_cache
+            try:
+                tmp_path = self._index_path.with_name(f"{REGISTRY_INDEX_NAME}.tmp")
+                tmp_path.write_bytes(_dump_json({"stamp": stamp, "components": index}))
+                os.replace(tmp_path, self._index_path)
+            except OSError as e:
+                self.logger.warning(f"Failed to write registry index: {e}")
+                return
             
+            self._index_cache = (stamp, self._index_file_stat(), index)
+            self._index_dirty = False
+    
+    def _load_search_index(self) -> Tuple[List[Tuple[str, Dict]], Dict[str, Set[int]]]:
+        """Build the inverted token index for search, reusing it while the registry is unchanged.
+        
         Returns:
-            Component metadata or None if not found
+            (category, manifest) refs in index order, and a mapping of each
+            lowercase token to the positions of components containing it
         """
-        component_dir = self.registry_path / category / name
-        manifest_path = component_dir / "component.json"
-        
-        if not manifest_path.exists():
-            return None
-        
-        try:
-            with manifest_path.open("r") as f:
-                return json.load(f)
-        except Exception as e:
-            self.logger.error(f"Failed to load component manifest: {e}")
-            return None
+        with self._index_lock:
+            index = self._load_index()
+            
+            # Keyed on the index object itself; _load_index returns the same
+            # dict for as long as the registry is unchanged, and saves reset it
+            if self._search_cache is not None and self._search_cache[0] is index:
+                return self._search_cache[1], self._search_cache[2]
+            
+            refs: List[Tuple[str, Dict]] = []
+            postings: Dict[str, Set[int]] = defaultdict(set)
+            for category, entries in index.items():
+                for component in entries.values():
+                    text = " ".join([component["name"], component["description"], *component["tags"]])
+                    for token in _SEARCH_TOKEN_RE.findall(text.lower()):
+                        postings[token].add(len(refs))
+                    refs.append((category, component))
+            
+            self._search_cache = (index, refs, postings)
+            return refs, postings
     
     def _categorize_component(self, source_path: Path, component_type: str) -> str:
         """Determine component category based on path and type.
@@ -230,7 +511,7 @@ class HarvestEngine:
             "description": description or f"Harvested from {source_path.name}",
             "files": [],
             "dependencies": [],
-            "tags": set(),
+            "tags": [],
             "quality_score": 0.0,
         }
         
@@ -239,15 +520,17 @@ class HarvestEngine:
             metadata["files"].append(source_path.name)
             metadata.update(self._analyze_file(source_path))
         else:
-            for file_path in source_path.rglob("*"):
-                if file_path.is_file():
-                    metadata["files"].append(str(file_path.relative_to(source_path)))
-                    file_analysis = self._analyze_file(file_path)
-                    metadata["dependencies"].extend(file_analysis.get("dependencies", []))
-        
-        # Remove duplicates and convert sets
-        metadata["dependencies"] = list(set(metadata["dependencies"]))
-        metadata["tags"] = list(metadata["tags"])
+            # List what _copy_component_files copies, not what a scan analyzes
+            copied_files = walk_files(
+                source_path, TRANSIENT_DIRS, skip_hidden=False, follow_symlinks=True
+            )
+            for entry, rel_path in copied_files:
+                metadata["files"].append(rel_path)
+                file_analysis = self._analyze_file(Path(entry.path))
+                metadata["dependencies"].extend(file_analysis.get("dependencies", []))
+        
+        # Remove duplicates, keeping first-seen order
+        metadata["dependencies"] = list(dict.fromkeys(metadata["dependencies"]))
         
         return metadata
     
@@ -262,34 +545,23 @@ class HarvestEngine:
         """
         analysis = {
             "dependencies": [],
-            "tags": set(),
+            "tags": [],
             "quality_score": 0.0,
             "lines_of_code": 0,
         }
         
         try:
-            with file_path.open("r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-                lines = content.splitlines()
-                analysis["lines_of_code"] = len(lines)
+            with file_path.open("rb") as f:
+                # Analyze only the head of large files, but count lines
+                # across the whole file without decoding the remainder
+                head = f.read(ANALYSIS_READ_LIMIT)
+                analysis["lines_of_code"] = count_lines(f, head)
                 
                 if file_path.suffix == ".py":
-                    # Extract Python imports
-                    import re
-                    
-                    # Standard imports
-                    imports = re.findall(r"^(?:import|from)\s+(\w+)", content, re.MULTILINE)
+                    # Extract imports, TODO/FIXME comments and definitions in one pass
+                    imports, tags = self._scan_python_source(head)
                     analysis["dependencies"].extend(imports)
-                    
-                    # Look for TODO/FIXME comments
-                    if re.search(r"#\s*(TODO|FIXME|NOTE)", content, re.IGNORECASE):
-                        analysis["tags"].add("has_todos")
-                    
-                    # Look for class/function definitions
-                    if re.search(r"def\s+\w+", content):
-                        analysis["tags"].add("has_functions")
-                    if re.search(r"class\s+\w+", content):
-                        analysis["tags"].add("has_classes")
+                    analysis["tags"].extend(tags)
                     
                     # Quality score based on structure
                     score = 0.0
@@ -304,13 +576,15 @@ class HarvestEngine:
                     analysis["quality_score"] = min(score, 1.0)
                 
                 elif file_path.suffix == ".js":
+                    content = head.decode("utf-8", errors="ignore")
+                    
                     # Extract JavaScript imports/requires
-                    imports = re.findall(r"(?:import|require)\s+[\"']([^\"']+)[\"']", content)
+                    imports = _JS_IMPORT_RE.findall(content)
                     analysis["dependencies"].extend(imports)
                     
                     # Look for function definitions
-                    if re.search(r"function\s+\w+", content):
-                        analysis["tags"].add("has_functions")
+                    if _JS_FN_RE.search(content):
+                        analysis["tags"].append("has_functions")
                     
                     # Quality score
                     score = 0.0
@@ -323,14 +597,14 @@ class HarvestEngine:
                     analysis["quality_score"] = min(score, 1.0)
                 
                 elif file_path.name == "manifest.json":
-                    analysis["tags"].add("chrome_manifest")
+                    analysis["tags"].append("chrome_manifest")
                     try:
-                        manifest_data = json.loads(content)
+                        manifest_data = orjson.loads(head)
                         if manifest_data.get("manifest_version") == 3:
-                            analysis["tags"].add("manifest_v3")
+                            analysis["tags"].append("manifest_v3")
                         analysis["dependencies"] = list(manifest_data.get("permissions", []))
                         analysis["quality_score"] = 0.8  # High score for manifests
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         pass
         
         except Exception as e:
@@ -338,6 +612,27 @@ class HarvestEngine:
         
         return analysis
     
+    def _scan_python_source(self, head: bytes) -> Tuple[List[str], List[str]]:
+        """Collect top-level import names and structure tags from Python source.
+        
+        Args:
+            head: Raw bytes from the start of the file
+            
+        Returns:
+            Tuple of (imported top-level modules, tags in the order
+            has_todos, has_functions, has_classes)
+        """
+        imports = []
+        found: Set[bytes] = set()
+        for match in _PY_SCAN_RE.finditer(b"\n" + head):
+            dependency = match.group("dependency")
+            if dependency is not None:
+                imports.append(dependency.decode("utf-8", errors="ignore"))
+            else:
+                found.add(match.group())
+        
+        return imports, [tag for kind, tag in _PY_SCAN_TAGS if kind in found]
+    
     def _copy_component_files(self, source_path: Path, dest_dir: Path) -> None:
         """Copy component files to destination directory.
         
@@ -347,25 +642,47 @@ class HarvestEngine:
         """
         dest_dir.mkdir(parents=True, exist_ok=True)
         
+        # copyfile skips metadata and lets the kernel copy the data directly
+        # (copy_file_range/sendfile on Linux, fcopyfile on macOS)
         if source_path.is_file():
-            shutil.copy2(source_path, dest_dir / source_path.name)
-        else:
-            shutil.copytree(source_path, dest_dir / source_path.name, dirs_exist_ok=True)
+            shutil.copyfile(source_path, dest_dir / source_path.name)
+            return
+        
+        # Copy the tree as-is (symlinked files by content, empty directories
+        # included), leaving out only VCS metadata, virtualenvs and caches.
+        # _extract_metadata lists files under the same rules.
+        shutil.copytree(
+            source_path,
+            dest_dir / source_path.name,
+            ignore=_ignore_transient_dirs,
+            copy_function=shutil.copyfile,
+            dirs_exist_ok=True,
+        )
     
     def _save_component_manifest(self, component_dir: Path, metadata: Dict) -> None:
-        """Save component manifest file.
+        """Save component manifest file and record it in the in-memory index.
         
         Args:
             component_dir: Component directory
             metadata: Component metadata
         """
-        manifest_path = component_dir / "component.json"
+        (component_dir / "component.json").write_bytes(_dump_json(metadata))
         
-        with manifest_path.open("w") as f:
-            json.dump(metadata, f, indent=2, default=str)
+        with self._index_lock:
+            # The caller validated the index before harvesting; this harvest's
+            # own new directories must not force a rebuild from every manifest
+            index = self._index_cache[2] if self._index_cache is not None else self._load_index()
+            index.setdefault(component_dir.parent.name, {})[component_dir.name] = metadata
+            
+            self._index_cache = (self._registry_stamp(), self._index_cache[1], index)
+            self._index_dirty = True
+            self._search_cache = None
     
     def display_components(self) -> None:
         """Display all components in a formatted table."""
+        from rich.table import Table
+        
+        console = get_console()
         components = self.list_components()
         
         if not components:
@@ -374,25 +691,28 @@ class HarvestEngine:
         
         console.print(f"\n[bold blue]Component Registry ({self.registry_path})[/bold blue]\n")
         
-        for category, component_list in components.items():
-            console.print(f"[bold]{category.title()}:[/bold]")
-            
-            table = Table()
-            table.add_column("Name", style="cyan")
-            table.add_column("Files", justify="right")
-            table.add_column("Quality", justify="right")
-            table.add_column("Tags", style="green")
-            
-            for component in component_list:
-                table.add_row(
-                    component["name"],
-                    str(len(component["files"])),
-                    f"{component['quality_score']:.2f}",
-                    ", ".join(component["tags"][:3])  # Show first 3 tags
-                )
-            
-            console.print(table)
-            console.print()
+        table = Table()
+        table.add_column("Category", style="magenta")
+        table.add_column("Name", style="cyan")
+        table.add_column("Files", justify="right")
+        table.add_column("Quality", justify="right")
+        table.add_column("Tags", style="green")
+        
+        rows = [
+            (
+                category.title(),
+                component["name"],
+                str(len(component["files"])),
+                f"{component['quality_score']:.2f}",
+                ", ".join(component["tags"][:3]),  # Show first 3 tags
+            )
+            for category, component_list in components.items()
+            for component in component_list
+        ]
+        for row in rows:
+            table.add_row(*row)
+        
+        console.print(table)
     
     def search_components(self, query: str) -> List[Dict]:
         """Search components by name, description, or tags.
@@ -403,20 +723,32 @@ class HarvestEngine:
         Returns:
             List of matching components
         """
-        results = []
-        components = self.list_components()
-        
         query_lower = query.lower()
+        refs, postings = self._load_search_index()
+        
+        # Narrow to components sharing a token with every query word. Any
+        # substring hit contains each query word inside some indexed token.
+        positions: Optional[Set[int]] = None
+        for word in set(_SEARCH_TOKEN_RE.findall(query_lower)):
+            hits: Set[int] = set()
+            for token, token_positions in postings.items():
+                if word in token:
+                    hits |= token_positions
+            positions = hits if positions is None else positions & hits
+            if not positions:
+                return []
+        
+        candidates = range(len(refs)) if positions is None else sorted(positions)
         
-        for category, component_list in components.items():
-            for component in component_list:
-                # Search in name, description, and tags
-                if (
-                    query_lower in component["name"].lower()
-                    or query_lower in component["description"].lower()
-                    or any(query_lower in tag.lower() for tag in component["tags"])
-                ):
-                    component["category"] = category
-                    results.append(component)
+        results = []
+        for position in candidates:
+            category, component = refs[position]
+            # Search in name, description, and tags
+            if (
+                query_lower in component["name"].lower()
+                or query_lower in component["description"].lower()
+                or any(query_lower in tag.lower() for tag in component["tags"])
+            ):
+                results.append({**_copy_manifest(component), "category": category})
         
         return results
\ No newline at end of file
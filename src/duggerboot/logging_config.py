@@ -5,131 +5,327 @@ Provides centralized logging with Loguru for application events
 and Rich integration for user-facing output.
 """
 
+import atexit
+import collections
+import functools
+import os
 import sys
+import time
+import traceback
 from pathlib import Path
-from typing import Any, Dict
-from loguru import logger
-from rich.console import Console
+from typing import TYPE_CHECKING, Any, Dict, Final, Literal, Optional, get_args
+
+from .console import get_console
+
+# Loguru, Rich and orjson are imported where first used, so importing the
+# engine (or running --help) doesn't load them
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.style import Style
+
+__all__ = ["DuggerLogger", "LogMode", "get_logger"]
+
+# "default": console + file sinks; "quiet": console only; "null": no sinks
+LogMode = Literal["default", "quiet", "null"]
+
+# Validation errors shown in the ERROR record; the full list goes to DEBUG
+_VALIDATION_ERRORS_SHOWN: Final[int] = 10
+
+# Buffered harvest and template-load records are flushed at this size or
+# after this many seconds
+_BUFFER_FLUSH_SIZE: Final[int] = 256
+_BUFFER_FLUSH_INTERVAL: Final[float] = 1.0
+
+# Console sink format, parsed by Loguru once per add(); names the bound component
+_CONSOLE_FMT: Final[str] = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{extra[component]}</cyan> | "
+    "<level>{message}</level>"
+)
+
+
+@functools.cache
+def _styles() -> Dict[str, tuple["Style", "Style"]]:
+    """Map display_* kind to (line style, title style), built once on first display."""
+    from rich.style import Style
+    
+    return {
+        "error": (Style(color="red"), Style(color="red", bold=True)),
+        "success": (Style(color="green"), Style(color="green", bold=True)),
+        "warning": (Style(color="yellow"), Style(color="yellow", bold=True)),
+        "info": (Style(color="blue"), Style(color="blue", bold=True)),
+    }
+
+
+def _file_format(record: Dict[str, Any]) -> str:
+    """Serialize a record to one orjson line for the file sink.
+    
+    Loguru only substitutes the pre-serialized line, so the file keeps the
+    full call site without running a multi-field format template.
+    """
+    import orjson
+    
+    entry = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "component": record["extra"].get("component"),
+        "location": f"{record['name']}:{record['function']}:{record['line']}",
+        "message": record["message"],
+    }
+    if record["exception"] is not None:
+        entry["exception"] = "".join(traceback.format_exception(*record["exception"]))
+    record["extra"]["_json"] = orjson.dumps(entry).decode()
+    return "{extra[_json]}\n"
+
+
+@functools.cache
+def _log_dir() -> Path:
+    """Resolve and create the log directory once per process."""
+    log_dir = Path.home() / ".duggerboot" / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    return log_dir
 
 
 class DuggerLogger:
     """Centralized logging system for DuggerBootTools."""
     
-    def __init__(self) -> None:
-        self.console = Console()
+    __slots__ = (
+        "mode",
+        "_log",
+        "_info",
+        "_warning",
+        "_error",
+        "_lazy",
+        "_is_tty",
+        "_buffer",
+        "_buffer_since",
+    )
+    
+    def __init__(self, mode: Optional[LogMode] = None) -> None:
+        """Initialize DuggerLogger.
+        
+        Args:
+            mode: Sink setup; defaults to $DUGGERBOOT_LOG_MODE, else "default"
+        """
+        if mode is None:
+            mode = os.environ.get("DUGGERBOOT_LOG_MODE", "default")
+        self.mode: LogMode = mode if mode in get_args(LogMode) else "default"
         self._setup_logging()
+        
+        from loguru import logger
+        
+        self._log = logger.bind(component="DuggerBoot")
+        # Resolve the level methods and the lazy-args logger once, not per call
+        self._info = self._log.info
+        self._warning = self._log.warning
+        self._error = self._log.error
+        self._lazy = self._log.opt(lazy=True)
+        # Piped/CI output gets plain lines; Rich is only used on a terminal
+        self._is_tty = sys.stdout.isatty()
+        # ("harvest" | "template", name, path) records not yet logged
+        self._buffer: collections.deque[tuple[str, str, Path]] = collections.deque(maxlen=1024)
+        # When the oldest buffered record was queued
+        self._buffer_since = time.monotonic()
+        atexit.register(self.flush)
+    
+    @property
+    def console(self) -> "Console":
+        """The shared Rich console for user-facing output."""
+        return get_console()
     
     def _setup_logging(self) -> None:
-        """Configure Loguru with appropriate handlers."""
+        """Configure Loguru with appropriate handlers.
+        
+        Sinks are synchronous: with Loguru's enqueue=True the caller still
+        formats and pickles every record before handing it to the writer, which
+        costs more per call than writing directly. The file sink batches its
+        writes in a buffer instead. In "null" mode no sink is installed, so
+        every log call returns before building a record.
+        """
+        from loguru import logger
+        
         # Remove default handler
         logger.remove()
+        if self.mode == "null":
+            return
+        # Records from unbound loggers still need a component for the console format
+        logger.configure(extra={"component": "duggerboot"})
+        debug = os.environ.get("DUGGERBOOT_DEBUG") == "1"
         
         # Add console handler with structured format
         logger.add(
             sys.stderr,
-            format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-                   "<level>{level: <8}</level> | "
-                   "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
-                   "<level>{message}</level>",
+            format=_CONSOLE_FMT,
             level="INFO",
             colorize=True,
+            # Variable-annotated tracebacks are costly; opt in with DUGGERBOOT_DEBUG=1
+            backtrace=debug,
+            diagnose=debug,
         )
         
-        # Add file logging for debugging
-        log_dir = Path.home() / ".duggerboot" / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
+        if self.mode == "quiet":
+            return
         
+        # Add JSON-lines file logging for debugging
         logger.add(
-            log_dir / "duggerboot.log",
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
+            _log_dir() / "duggerboot.log",
+            format=_file_format,
             level="DEBUG",
-            rotation="10 MB",
+            rotation="64 MB",
             retention="7 days",
             compression="gz",
+            # Open on first record and batch writes in a 64 KiB buffer; Loguru
+            # closes (and so flushes) the file at exit
+            delay=True,
+            buffering=1 << 16,
+            backtrace=False,
+            diagnose=False,
         )
     
     def log_bootstrap_start(self, project_name: str, template_type: str) -> None:
         """Log project bootstrap initiation."""
-        logger.info(f"Starting bootstrap: project='{project_name}' template='{template_type}'")
+        self._info("Starting bootstrap: project='{}' template='{}'", project_name, template_type)
     
     def log_bootstrap_success(self, project_path: Path) -> None:
         """Log successful bootstrap completion."""
-        logger.info(f"Bootstrap completed successfully: path='{project_path}'")
+        # Keep buffered template loads ahead of the outcome
+        self.flush()
+        self._lazy.info("Bootstrap completed successfully: path='{}'", lambda: project_path)
     
     def log_bootstrap_failure(self, project_name: str, error: Exception) -> None:
         """Log bootstrap failure with context."""
-        logger.error(f"Bootstrap failed: project='{project_name}' error='{str(error)}'")
-        logger.exception("Bootstrap failure details")
+        self.flush()
+        # Attach the traceback to the same record, and only when one exists
+        log = self._log.opt(exception=error) if error.__traceback__ is not None else self._log
+        log.error("Bootstrap failed: project='{}' error='{}'", project_name, error)
     
     def log_dependency_check(self, template_name: str, is_compatible: bool, issues: list[str]) -> None:
         """Log dependency compatibility check results."""
         if is_compatible:
-            logger.info(f"Dependency check passed: template='{template_name}'")
+            self._info("Dependency check passed: template='{}'", template_name)
         else:
-            logger.warning(f"Dependency check failed: template='{template_name}' issues={issues}")
+            self._warning("Dependency check failed: template='{}' issues={}", template_name, issues)
     
     def log_template_load(self, template_name: str, template_path: Path) -> None:
-        """Log template loading."""
-        logger.debug(f"Template loaded: name='{template_name}' path='{template_path}'")
+        """Log template loading; buffered and written in batches."""
+        self._buffer_record("template", template_name, template_path)
     
     def log_git_operation(self, operation: str, project_path: Path, success: bool) -> None:
         """Log Git operations."""
         if success:
-            logger.info(f"Git operation successful: operation='{operation}' path='{project_path}'")
+            self._lazy.info(
+                "Git operation successful: operation='{}' path='{}'", lambda: operation, lambda: project_path
+            )
         else:
-            logger.error(f"Git operation failed: operation='{operation}' path='{project_path}'")
+            self._error("Git operation failed: operation='{}' path='{}'", operation, project_path)
     
     def log_rollback(self, project_path: Path, reason: str) -> None:
         """Log rollback operations."""
-        logger.warning(f"Rollback initiated: path='{project_path}' reason='{reason}'")
+        self._warning("Rollback initiated: path='{}' reason='{}'", project_path, reason)
     
     def log_scout_start(self, scan_path: Path) -> None:
         """Log ecosystem scout initiation."""
-        logger.info(f"Starting ecosystem scan: path='{scan_path}'")
+        self._lazy.info("Starting ecosystem scan: path='{}'", lambda: scan_path)
     
     def log_scout_results(self, projects_found: int, retrofit_candidates: int) -> None:
         """Log scout results."""
-        logger.info(f"Scan completed: projects_found={projects_found} retrofit_candidates={retrofit_candidates}")
+        self._info(
+            "Scan completed: projects_found={} retrofit_candidates={}", projects_found, retrofit_candidates
+        )
     
-    def log_harvest_operation(self, component_name: str, source_path: Path, success: bool) -> None:
-        """Log component harvest operations."""
+    def log_harvest_operation(
+        self, component_name: str, source_path: Path, success: bool, error: Optional[Exception] = None
+    ) -> None:
+        """Log component harvest operations.
+        
+        Successes are buffered and written in batches; a failure flushes
+        pending records first and is logged immediately.
+        """
         if success:
-            logger.info(f"Component harvested: name='{component_name}' source='{source_path}'")
+            self._buffer_record("harvest", component_name, source_path)
         else:
-            logger.error(f"Harvest failed: name='{component_name}' source='{source_path}'")
+            self.flush()
+            self._error(
+                "Harvest failed: name='{}' source='{}' error='{}'", component_name, source_path, error
+            )
     
-    def log_validation_error(self, file_path: Path, validation_errors: list[str]) -> None:
-        """Log validation errors."""
-        logger.error(f"Validation failed: file='{file_path}' errors={validation_errors}")
-    
-    def display_error(self, title: str, message: str) -> None:
-        """Display error to user with Rich formatting."""
-        self.console.print(
-            f"[bold red]{title}[/bold red]: {message}",
-            style="red"
-        )
+    def _buffer_record(self, kind: str, name: str, path: Path) -> None:
+        """Queue a record, flushing once the buffer is full or its oldest record is stale."""
+        if not self._buffer:
+            self._buffer_since = time.monotonic()
+        self._buffer.append((kind, name, path))
+        if (
+            len(self._buffer) >= _BUFFER_FLUSH_SIZE
+            or time.monotonic() - self._buffer_since > _BUFFER_FLUSH_INTERVAL
+        ):
+            self.flush()
     
-    def display_success(self, title: str, message: str) -> None:
-        """Display success message to user."""
-        self.console.print(
-            f"[bold green]{title}[/bold green]: {message}",
-            style="green"
-        )
+    def flush(self) -> None:
+        """Write buffered harvest and template-load records, one record per kind."""
+        harvests, templates = [], []
+        while self._buffer:
+            try:
+                kind, name, path = self._buffer.popleft()
+            except IndexError:
+                break
+            (harvests if kind == "harvest" else templates).append((name, path))
+        
+        if harvests:
+            self._lazy.info(
+                "Components harvested ({}): {}",
+                lambda: len(harvests),
+                lambda: "; ".join(f"name='{name}' source='{source}'" for name, source in harvests),
+            )
+        if templates:
+            self._lazy.debug(
+                "Templates loaded ({}): {}",
+                lambda: len(templates),
+                lambda: "; ".join(f"name='{name}' path='{path}'" for name, path in templates),
+            )
     
-    def display_warning(self, title: str, message: str) -> None:
-        """Display warning message to user."""
-        self.console.print(
-            f"[bold yellow]{title}[/bold yellow]: {message}",
-            style="yellow"
+    def log_validation_error(self, file_path: Path, validation_errors: list[str]) -> None:
+        """Log validation errors, capping how many appear in the error record."""
+        if not validation_errors:
+            return
+        
+        self._error(
+            "Validation failed: file='{}' error_count={} first={}",
+            file_path,
+            len(validation_errors),
+            validation_errors[:_VALIDATION_ERRORS_SHOWN],
         )
+        if len(validation_errors) > _VALIDATION_ERRORS_SHOWN:
+            self._lazy.debug(
+                "Validation full list: file='{}' errors={}", lambda: file_path, lambda: validation_errors
+            )
     
-    def display_info(self, title: str, message: str) -> None:
-        """Display info message to user."""
-        self.console.print(
-            f"[bold blue]{title}[/bold blue]: {message}",
-            style="blue"
-        )
+    def _display(self, kind: str, title: str, message: str) -> None:
+        """Display a titled message to the user in the style for kind."""
+        if not self._is_tty:
+            sys.stdout.write(f"{title}: {message}\n")
+            return
+        
+        from rich.text import Text
+        
+        line_style, title_style = _styles()[kind]
+        self.console.print(Text.assemble((title, title_style), ": ", message, style=line_style))
+    
+    display_error = functools.partialmethod(_display, "error")
+    display_success = functools.partialmethod(_display, "success")
+    display_warning = functools.partialmethod(_display, "warning")
+    display_info = functools.partialmethod(_display, "info")
+
+
+@functools.cache
+def get_logger() -> DuggerLogger:
+    """Return the shared DuggerLogger, configuring sinks on first use."""
+    return DuggerLogger()
 
 
-# Global logger instance
-dugger_logger = DuggerLogger()
+def __getattr__(name: str) -> Any:
+    # Keep ``from .logging_config import dugger_logger`` working without
+    # configuring logging at import time
+    if name == "dugger_logger":
+        return get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,15 +4,24 @@ Project Scout - Historical Indexer for the Dugger ecosystem.
 Intelligent repository analysis for code recycling and harvestable component identification.
 """
 
-import json
+import hashlib
+import heapq
 import os
 import re
+import sys
+import time
+import tomllib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
 
+import orjson
 from loguru import logger
-from rich.console import Console
+from packaging.requirements import Requirement
+from rich.console import Group
 from rich.table import Table
 
 from duggerlink.models.inventory import (
@@ -25,7 +34,200 @@ from duggerlink.models.inventory import (
     ProjectStack,
 )
 
-console = Console()
+from .console import get_console
+from .filesystem import ANALYSIS_READ_LIMIT, count_lines, walk_files
+from .logging_config import get_logger
+
+# Scans of at most this many projects run serially; pool startup isn't worth it
+PARALLEL_SCAN_THRESHOLD = 2
+
+# Per-project analysis results reused by later scans while the project is unchanged
+SCAN_CACHE_NAME = "cache.json"
+
+# Cached analyses older than this are redone; active_development depends on the date
+SCAN_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Bump whenever detection or scoring changes so older cached analyses are dropped
+SCAN_CACHE_VERSION = 1
+
+# Harvest candidates listed in ECOSYSTEM_MAP.md (the console summary shows 5)
+MAP_TOP_CANDIDATES = 10
+
+# Retrofit candidates suggested on the console and listed in the map
+RETROFIT_SUGGESTIONS = 5
+
+# ADR-003 commit.py bridge stub, identical for every project so encoded once
+_BRIDGE_STUB = '''try:
+    from duggerlink.cli.commit import main
+except ImportError:
+    print("❌ DuggerLinkTools not found. Run: pip install -e C:\\\\Github\\\\DuggerLinkTools")
+    exit(1)
+
+if __name__ == "__main__":
+    main()
+'''
+_BRIDGE_STUB_BYTES = _BRIDGE_STUB.encode("utf-8")
+
+# Source analysis patterns, matched against raw file bytes to skip decoding
+_DEF_RE = re.compile(rb"def\s+\w+")
+_CLASS_RE = re.compile(rb"class\s+\w+")
+_IMPORT_LINE_RE = re.compile(rb"^(?:import|from)\s+", re.MULTILINE)
+_PY_IMPORT_RE = re.compile(rb"^(?:import|from)\s+(\w+)", re.MULTILINE)
+_JS_IMPORT_RE = re.compile(rb"(?:require|import)\s+[\"']([^\"']+)[\"']")
+
+
+def _split_patterns(patterns: List[str]) -> Tuple[Tuple[str, ...], Optional[re.Pattern[str]]]:
+    """Partition regex patterns into plain substrings and one compiled alternation.
+
+    Patterns without metacharacters are returned lowercased for "in" checks
+    against lowercased names; the rest are joined into a case-insensitive
+    alternation, or None if there are none.
+    """
+    literals = tuple(pattern.lower() for pattern in patterns if re.escape(pattern) == pattern)
+    regexes = [pattern for pattern in patterns if re.escape(pattern) != pattern]
+    if not regexes:
+        return literals, None
+    return literals, re.compile("|".join(f"(?:{pattern})" for pattern in regexes), re.IGNORECASE)
+
+
+class _MapRow(NamedTuple):
+    """The fields of one project that ECOSYSTEM_MAP.md lists."""
+    
+    name: str
+    path: Path
+    stack: ProjectStack
+    dna_status: DNAStatus
+    code_files: int
+    test_files: int
+    harvestable: int
+
+
+class EcosystemSummary:
+    """Running aggregates of an ecosystem scan, built one project at a time.
+    
+    Holds what the console summary and ECOSYSTEM_MAP.md report: counts,
+    distributions, one map row per project, and only the best harvest and
+    retrofit candidates. Whole ProjectInventory objects are not retained.
+    Which candidates qualify is decided by EcosystemInventory itself.
+    """
+    
+    def __init__(self, scan_date: Optional[datetime] = None):
+        """Initialize an empty summary.
+        
+        Args:
+            scan_date: When the scan started, defaults to now
+        """
+        self.scan_date = scan_date or datetime.now()
+        self.total_projects = 0
+        self.stack_distribution: Dict[ProjectStack, int] = {}
+        self.family_distribution: Dict[ProjectFamily, int] = {}
+        self.dna_status_distribution: Dict[DNAStatus, int] = {}
+        self.rows_by_family: Dict[ProjectFamily, List[_MapRow]] = {}
+        self.harvest_candidate_count = 0
+        self.retrofit_candidate_count = 0
+        # Min-heaps of (score, -arrival, item) holding only the best few
+        self._top_candidates: List[Tuple[float, int, HarvestCandidate]] = []
+        self._top_retrofits: List[Tuple[float, int, ProjectInventory]] = []
+        self._arrivals = 0
+    
+    @classmethod
+    def from_inventory(cls, inventory: EcosystemInventory) -> "EcosystemSummary":
+        """Summarize a complete inventory using its own computed fields.
+        
+        Args:
+            inventory: Ecosystem inventory
+            
+        Returns:
+            Summary of the inventory
+        """
+        summary = cls(inventory.scan_date)
+        summary.total_projects = inventory.total_projects
+        summary.stack_distribution = dict(inventory.stack_distribution)
+        summary.family_distribution = dict(inventory.family_distribution)
+        summary.dna_status_distribution = dict(inventory.dna_status_distribution)
+        for project in inventory.projects:
+            summary._add_row(project)
+        
+        candidates = inventory.top_harvest_candidates
+        summary.harvest_candidate_count = len(candidates)
+        for candidate in candidates[:MAP_TOP_CANDIDATES]:
+            summary._keep(summary._top_candidates, MAP_TOP_CANDIDATES, 0.0, candidate)
+        
+        retrofits = inventory.retrofit_candidates
+        summary.retrofit_candidate_count = len(retrofits)
+        for project in retrofits[:RETROFIT_SUGGESTIONS]:
+            summary._keep(summary._top_retrofits, RETROFIT_SUGGESTIONS, 0.0, project)
+        
+        return summary
+    
+    def add(self, project: ProjectInventory) -> None:
+        """Fold one analyzed project into the summary.
+        
+        Args:
+            project: Project inventory
+        """
+        self.total_projects += 1
+        for distribution, key in (
+            (self.stack_distribution, project.stack),
+            (self.family_distribution, project.family),
+            (self.dna_status_distribution, project.dna_status),
+        ):
+            distribution[key] = distribution.get(key, 0) + 1
+        self._add_row(project)
+        
+        # A one-project inventory applies the model's own candidate rules
+        single = EcosystemInventory(total_projects=1, projects=[project])
+        
+        candidates = single.top_harvest_candidates
+        self.harvest_candidate_count += len(candidates)
+        for candidate in candidates:
+            self._keep(self._top_candidates, MAP_TOP_CANDIDATES, candidate.harvest_score, candidate)
+        
+        if single.retrofit_candidates:
+            self.retrofit_candidate_count += 1
+            self._keep(self._top_retrofits, RETROFIT_SUGGESTIONS, project.retrofit_priority, project)
+    
+    @property
+    def top_harvest_candidates(self) -> List[HarvestCandidate]:
+        """Best harvest candidates, highest score first."""
+        return [item for _, _, item in sorted(self._top_candidates, reverse=True)]
+    
+    @property
+    def retrofit_candidates(self) -> List[ProjectInventory]:
+        """Highest-priority retrofit candidates, highest first."""
+        return [item for _, _, item in sorted(self._top_retrofits, reverse=True)]
+    
+    def _add_row(self, project: ProjectInventory) -> None:
+        """Record the map row for a project under its family."""
+        self.rows_by_family.setdefault(project.family, []).append(
+            _MapRow(
+                project.name,
+                project.path,
+                project.stack,
+                project.dna_status,
+                project.metrics.code_files,
+                project.metrics.test_files,
+                len(project.harvest_candidates),
+            )
+        )
+    
+    def _keep(self, heap: List[Tuple], limit: int, score: float, item: object) -> None:
+        """Push item onto a bounded min-heap; on equal scores, earlier items win."""
+        self._arrivals += 1
+        entry = (score, -self._arrivals, item)
+        if len(heap) < limit:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+
+def _new_candidate_table() -> Table:
+    """Create the empty harvest candidates table used by display_summary."""
+    table = Table()
+    table.add_column("File", style="cyan")
+    table.add_column("Score", justify="right")
+    table.add_column("Tags", style="green")
+    return table
 
 
 class ProjectScout:
@@ -73,24 +275,42 @@ class ProjectScout:
         ProjectStack.TYPESCRIPT: [".ts", ".tsx", "tsconfig.json"],
     }
     
-    # High-value file patterns
+    # High-value file patterns, matched case-insensitively against the file name
     HIGH_VALUE_PATTERNS = [
-        r".*\.py$",  # Python files
-        r".*\.js$",  # JavaScript files
-        r"manifest\.json$",  # Chrome manifests
-        r".*config\..*$",  # Configuration files
-        r".*client\..*$",  # API clients
-        r".*scraper\..*$",  # Scrapers
+        ("suffix", ".py"),  # Python files
+        ("suffix", ".js"),  # JavaScript files
+        ("suffix", "manifest.json"),  # Chrome manifests
+        ("contains", "config."),  # Configuration files
+        ("contains", "client."),  # API clients
+        ("contains", "scraper."),  # Scrapers
     ]
     
-    def __init__(self, ecosystem_root: Path):
+    # Per category: literal substrings checked with "in", remaining patterns
+    # compiled once into a single case-insensitive alternation
+    UTILITY_CATEGORY_MATCHERS = {
+        category: _split_patterns(patterns) for category, patterns in UTILITY_PATTERNS.items()
+    }
+    
+    # High-value patterns grouped by kind for plain str.endswith/in tests
+    HIGH_VALUE_SUFFIXES = tuple(text for kind, text in HIGH_VALUE_PATTERNS if kind == "suffix")
+    HIGH_VALUE_SUBSTRINGS = tuple(text for kind, text in HIGH_VALUE_PATTERNS if kind == "contains")
+    
+    def __init__(self, ecosystem_root: Path, cache_path: Optional[Path] = None):
         """Initialize ProjectScout.
         
         Args:
             ecosystem_root: Root directory containing all projects (e.g., C:\GitHub)
+            cache_path: Scan cache file, defaults to ~/.duggerboot/cache.json
         """
         self.ecosystem_root = ecosystem_root
+        # Log through the shared DuggerLogger sinks, as the bootstrap engine does,
+        # rather than Loguru's default DEBUG-level stderr handler
+        get_logger()
         self.logger = logger.bind(component="ProjectScout")
+        self.cache_path = cache_path or Path.home() / ".duggerboot" / SCAN_CACHE_NAME
+        # str(project path) -> {"fingerprint", "scanned_at", "inventory"}; analysis
+        # threads each write only their own key
+        self._scan_cache: Dict[str, Dict] = {}
     
     def scan_ecosystem(self, suggest_recycle: bool = False) -> EcosystemInventory:
         """Perform complete ecosystem scan.
@@ -103,19 +323,7 @@ class ProjectScout:
         """
         self.logger.info(f"Starting ecosystem scan of {self.ecosystem_root}")
         
-        # Discover all project directories
-        project_dirs = self._discover_projects()
-        self.logger.info(f"Found {len(project_dirs)} project directories")
-        
-        # Analyze each project
-        projects = []
-        for project_dir in project_dirs:
-            try:
-                project = self._analyze_project(project_dir)
-                projects.append(project)
-                self.logger.info(f"Analyzed {project.name}: {project.stack} - {project.dna_status}")
-            except Exception as e:
-                self.logger.error(f"Failed to analyze {project_dir}: {e}")
+        projects = list(self.iter_projects())
         
         # Create ecosystem inventory
         inventory = EcosystemInventory(
@@ -130,6 +338,80 @@ class ProjectScout:
         self.logger.info(f"Ecosystem scan complete: {len(projects)} projects analyzed")
         return inventory
     
+    def summarize_ecosystem(self, suggest_recycle: bool = False) -> EcosystemSummary:
+        """Scan the ecosystem, keeping only running aggregates of the results.
+        
+        Each project is folded into the summary as it arrives and then
+        released, so peak memory no longer grows with every project's full
+        inventory and harvest candidates.
+        
+        Args:
+            suggest_recycle: Whether to suggest retrofit commands
+            
+        Returns:
+            Summary for display_summary and generate_ecosystem_map
+        """
+        self.logger.info(f"Starting ecosystem scan of {self.ecosystem_root}")
+        
+        summary = EcosystemSummary()
+        for project in self.iter_projects():
+            summary.add(project)
+        
+        if suggest_recycle:
+            self._suggest_retrofit_commands(summary)
+        
+        self.logger.info(f"Ecosystem scan complete: {summary.total_projects} projects analyzed")
+        return summary
+    
+    def iter_projects(self) -> Iterator[ProjectInventory]:
+        """Analyze ecosystem projects, yielding each one as soon as it is ready.
+        
+        Projects come back in discovery order; ones that fail to analyze are
+        logged and skipped. The scan cache is saved when iteration ends.
+        
+        Returns:
+            Iterator over project inventories
+        """
+        # Discover all project directories
+        project_dirs = self._discover_projects()
+        self.logger.info(f"Found {len(project_dirs)} project directories")
+        
+        self._scan_cache = self._load_cache()
+        
+        def analyze(project_dir: Path) -> Optional[ProjectInventory]:
+            try:
+                project = self._analyze_project(project_dir)
+                self.logger.info(f"Analyzed {project.name}: {project.stack} - {project.dna_status}")
+                return project
+            except Exception as e:
+                self.logger.error(f"Failed to analyze {project_dir}: {e}")
+                return None
+        
+        # Analyze each project; the work is I/O and git subprocesses, so
+        # threads overlap well. map() keeps results in discovery order.
+        try:
+            if len(project_dirs) <= PARALLEL_SCAN_THRESHOLD:
+                for project in map(analyze, project_dirs):
+                    if project is not None:
+                        yield project
+            else:
+                max_workers = min(32, (os.cpu_count() or 1) * 4)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for project in executor.map(analyze, project_dirs):
+                        if project is not None:
+                            yield project
+        finally:
+            # Forget projects under this root that have since been removed or
+            # renamed; other roots share the cache file and are left alone
+            discovered = {str(project_dir) for project_dir in project_dirs}
+            root = str(self.ecosystem_root)
+            self._scan_cache = {
+                key: value
+                for key, value in self._scan_cache.items()
+                if key in discovered or os.path.dirname(key) != root
+            }
+            self._save_cache()
+    
     def _discover_projects(self) -> List[Path]:
         """Discover project directories using fast os.scandir().
         
@@ -203,8 +485,25 @@ class ProjectScout:
         # Basic project info
         name = project_dir.name
         
+        # Walk the tree once; every file-level analysis shares this listing
+        entries = [entry for entry, _ in walk_files(project_dir)]
+        
+        # Reuse the previous analysis if nothing in the project has changed
+        cache_key = str(project_dir)
+        fingerprint = self._project_fingerprint(project_dir, entries)
+        cached = self._scan_cache.get(cache_key)
+        if (
+            cached is not None
+            and cached["fingerprint"] == fingerprint
+            and time.time() - cached["scanned_at"] < SCAN_CACHE_MAX_AGE
+        ):
+            try:
+                return ProjectInventory.model_validate(cached["inventory"])
+            except Exception as e:
+                self.logger.debug(f"Discarding cached analysis for {project_dir}: {e}")
+        
         # Detect stack
-        stack = self._detect_stack(project_dir)
+        stack = self._detect_stack(project_dir, entries)
         
         # Detect family
         family = self._detect_family(project_dir, name)
@@ -213,18 +512,18 @@ class ProjectScout:
         dna_status = self._check_dna_status(project_dir)
         
         # Calculate metrics
-        metrics = self._calculate_metrics(project_dir)
+        metrics = self._calculate_metrics(project_dir, entries)
         
         # Find harvest candidates
-        harvest_candidates = self._find_harvest_candidates(project_dir)
+        harvest_candidates = self._find_harvest_candidates(project_dir, entries)
         
         # Detect dependencies
         dependencies = self._detect_dependencies(project_dir, stack)
         
         # Quality indicators
-        quality_indicators = self._assess_quality(project_dir)
+        quality_indicators = self._assess_quality(project_dir, entries)
         
-        return ProjectInventory(
+        project = ProjectInventory(
             name=name,
             path=project_dir,
             stack=stack,
@@ -235,23 +534,101 @@ class ProjectScout:
             dependencies=dependencies,
             quality_indicators=quality_indicators,
         )
+        
+        self._scan_cache[cache_key] = {
+            "fingerprint": fingerprint,
+            "scanned_at": time.time(),
+            "inventory": project.model_dump(mode="json"),
+        }
+        return project
+    
+    def _project_fingerprint(self, project_dir: Path, entries: List[os.DirEntry]) -> List:
+        """Summarize a project's state for scan cache validation.
+        
+        Every file's path, size and mtime go into the digest, so renames and
+        moves invalidate the cache even though they keep mtimes and the count.
+        The walk skips dot-directories, so .github/ (CI detection) is added
+        separately along with whether .git and .github exist at all; root
+        files such as dugger.yaml and manifest.json already come through
+        entries.
+        
+        Args:
+            project_dir: Project directory path
+            entries: File entries from walk_files(project_dir)
+            
+        Returns:
+            Digest of (path, size, mtime_ns) per file, file count, the git
+            reflog mtime_ns (0 if absent), and .git/.github presence
+        """
+        github_dir = project_dir / ".github"
+        digest = hashlib.blake2b(digest_size=16)
+        for entry in chain(entries, (entry for entry, _ in walk_files(github_dir, skip_hidden=False))):
+            try:
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            digest.update(f"{entry.path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8", "surrogateescape"))
+        
+        # New commits change the commit count without touching the work tree
+        try:
+            git_mtime = (project_dir / ".git" / "logs" / "HEAD").stat().st_mtime_ns
+        except OSError:
+            git_mtime = 0
+        
+        # has_git and has_ci only look for the directories, which may be empty
+        markers = [(project_dir / ".git").exists(), github_dir.exists()]
+        
+        return [digest.hexdigest(), len(entries), git_mtime, markers]
+    
+    def _load_cache(self) -> Dict[str, Dict]:
+        """Load the scan cache, starting empty if it is missing or unreadable.
+        
+        Returns:
+            Mapping of project path to cached analysis
+        """
+        try:
+            data = orjson.loads(self.cache_path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable scan cache {self.cache_path}: {e}")
+            return {}
+        
+        # Entries written by other versions of the analysis can't be trusted
+        if not isinstance(data, dict) or data.get("version") != SCAN_CACHE_VERSION:
+            return {}
+        return data.get("projects", {})
+    
+    def _save_cache(self) -> None:
+        """Atomically write the scan cache."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.tmp")
+            tmp_path.write_bytes(orjson.dumps({"version": SCAN_CACHE_VERSION, "projects": self._scan_cache}))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write scan cache {self.cache_path}: {e}")
     
-    def _detect_stack(self, project_dir: Path) -> ProjectStack:
+    def _detect_stack(
+        self, project_dir: Path, entries: Optional[List[os.DirEntry]] = None
+    ) -> ProjectStack:
         """Detect the technology stack of a project.
         
         Args:
             project_dir: Project directory path
+            entries: File entries from walk_files(project_dir), walked if omitted
             
         Returns:
             Detected project stack
         """
-        stack_scores = {stack: 0 for stack in ProjectStack}
+        if entries is None:
+            entries = [entry for entry, _ in walk_files(project_dir)]
         
-        # Count files matching each stack pattern
+        # Count files whose name matches each stack pattern, from one name histogram
+        name_counts = Counter(entry.name for entry in entries)
+        stack_scores = {stack: 0 for stack in ProjectStack}
         for stack, patterns in self.STACK_PATTERNS.items():
-            for pattern in patterns:
-                matches = list(project_dir.rglob(pattern))
-                stack_scores[stack] += len(matches)
+            stack_scores[stack] += sum(name_counts[pattern] for pattern in patterns)
         
         # Find stack with highest score
         best_stack = max(stack_scores, key=stack_scores.get)
@@ -314,15 +691,21 @@ class ProjectScout:
             self.logger.debug(f"DNA validation failed for {project_dir}: {e}")
             return DNAStatus.INVALID
     
-    def _calculate_metrics(self, project_dir: Path) -> ProjectMetrics:
+    def _calculate_metrics(
+        self, project_dir: Path, entries: Optional[List[os.DirEntry]] = None
+    ) -> ProjectMetrics:
         """Calculate project metrics.
         
         Args:
             project_dir: Project directory path
+            entries: File entries from walk_files(project_dir), walked if omitted
             
         Returns:
             Project metrics
         """
+        if entries is None:
+            entries = [entry for entry, _ in walk_files(project_dir)]
+        
         total_files = 0
         code_files = 0
         test_files = 0
@@ -331,31 +714,31 @@ class ProjectScout:
         lines_of_code = 0
         
         # Walk through all files
-        for file_path in project_dir.rglob("*"):
-            if file_path.is_file():
-                total_files += 1
-                
-                # Categorize files
-                if file_path.suffix in [".py", ".js", ".ts", ".jsx", ".tsx"]:
-                    code_files += 1
-                    try:
-                        with file_path.open("r", encoding="utf-8", errors="ignore") as f:
-                            lines_of_code += len(f.readlines())
-                    except Exception:
-                        pass
-                
-                elif "test" in file_path.name.lower():
-                    test_files += 1
-                
-                elif file_path.name in ["config", "settings", "manifest", "package"]:
-                    config_files += 1
-                
-                elif file_path.suffix in [".md", ".rst", ".txt"]:
-                    documentation_files += 1
+        for entry in entries:
+            total_files += 1
+            suffix = os.path.splitext(entry.name)[1]
+            
+            # Categorize files
+            if suffix in [".py", ".js", ".ts", ".jsx", ".tsx"]:
+                code_files += 1
+                try:
+                    with open(entry.path, "rb") as f:
+                        lines_of_code += count_lines(f)
+                except Exception:
+                    pass
+            
+            elif "test" in entry.name.lower():
+                test_files += 1
+            
+            elif entry.name in ["config", "settings", "manifest", "package"]:
+                config_files += 1
+            
+            elif suffix in [".md", ".rst", ".txt"]:
+                documentation_files += 1
         
         # Get git info
         git_commits = self._get_git_commit_count(project_dir)
-        last_modified = self._get_last_modified(project_dir)
+        last_modified = self._get_last_modified(project_dir, entries)
         
         # Calculate complexity score (simplified)
         complexity_score = min(lines_of_code / 10000, 1.0)
@@ -377,41 +760,42 @@ class ProjectScout:
             active_development=active_development,
         )
     
-    def _find_harvest_candidates(self, project_dir: Path) -> List[HarvestCandidate]:
+    def _find_harvest_candidates(
+        self, project_dir: Path, entries: Optional[List[os.DirEntry]] = None
+    ) -> List[HarvestCandidate]:
         """Find harvestable components in project.
         
         Args:
             project_dir: Project directory path
+            entries: File entries from walk_files(project_dir), walked if omitted
             
         Returns:
             List of harvest candidates
         """
+        if entries is None:
+            entries = [entry for entry, _ in walk_files(project_dir)]
         candidates = []
         
-        for file_path in project_dir.rglob("*"):
-            if not file_path.is_file():
-                continue
-            
+        for entry in entries:
             # Check if file matches high-value patterns
-            if not self._is_high_value_file(file_path):
+            if not self._is_high_value_file(entry):
                 continue
             
             # Calculate scores
-            complexity_score = self._calculate_complexity_score(file_path)
-            utility_score = self._calculate_utility_score(file_path)
-            uniqueness_score = self._calculate_uniqueness_score(file_path)
+            complexity_score, dependencies = self._analyze_file_content(entry.path)
+            utility_score = self._calculate_utility_score(entry.name)
+            uniqueness_score = self._calculate_uniqueness_score(entry)
             
             # Overall harvest score
             harvest_score = (complexity_score + utility_score + uniqueness_score) / 3
             
             # Only include if harvestable
             if harvest_score > 0.5:
-                tags = self._extract_file_tags(file_path)
-                dependencies = self._extract_file_dependencies(file_path)
+                tags = self._extract_file_tags(entry.name)
                 
                 candidates.append(HarvestCandidate(
-                    file_path=file_path.relative_to(project_dir),
-                    file_type=file_path.suffix,
+                    file_path=Path(os.path.relpath(entry.path, project_dir)),
+                    file_type=os.path.splitext(entry.name)[1],
                     complexity_score=complexity_score,
                     utility_score=utility_score,
                     uniqueness_score=uniqueness_score,
@@ -424,74 +808,86 @@ class ProjectScout:
         candidates.sort(key=lambda hc: hc.harvest_score, reverse=True)
         return candidates[:10]  # Top 10 candidates per project
     
-    def _is_high_value_file(self, file_path: Path) -> bool:
+    def _is_high_value_file(self, entry: os.DirEntry) -> bool:
         """Check if file is potentially high-value.
         
         Args:
-            file_path: File path to check
+            entry: File entry to check
             
         Returns:
             True if file is high-value
         """
+        name = entry.name.lower()
+        
         # Check against high-value patterns
-        for pattern in self.HIGH_VALUE_PATTERNS:
-            if re.search(pattern, file_path.name, re.IGNORECASE):
-                return True
+        if name.endswith(self.HIGH_VALUE_SUFFIXES):
+            return True
+        if any(text in name for text in self.HIGH_VALUE_SUBSTRINGS):
+            return True
         
         # Check file size (larger files might be more valuable)
         try:
-            if file_path.stat().st_size > 1000:  # > 1KB
+            if entry.stat().st_size > 1000:  # > 1KB
                 return True
         except Exception:
             pass
         
         return False
     
-    def _calculate_complexity_score(self, file_path: Path) -> float:
-        """Calculate complexity score for a file.
+    def _analyze_file_content(self, file_path: str) -> Tuple[float, List[str]]:
+        """Score complexity and extract dependencies from a single read of a file.
         
         Args:
             file_path: File path to analyze
             
         Returns:
-            Complexity score (0.0 to 1.0)
+            Complexity score (0.0 to 1.0) and up to 5 dependencies
         """
+        suffix = os.path.splitext(file_path)[1]
         try:
-            with file_path.open("r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-                lines = len(content.splitlines())
-                
-                # Simple complexity based on lines and unique constructs
-                if file_path.suffix == ".py":
-                    functions = len(re.findall(r"def\s+\w+", content))
-                    classes = len(re.findall(r"class\s+\w+", content))
-                    imports = len(re.findall(r"^(import|from)\s+", content, re.MULTILINE))
-                    
-                    complexity = min((functions * 0.3 + classes * 0.4 + imports * 0.2 + lines / 1000 * 0.1), 1.0)
-                else:
-                    # For other files, use line count as proxy
-                    complexity = min(lines / 500, 1.0)
-                
-                return complexity
+            with open(file_path, "rb") as f:
+                # Analyze only the head of large files, but count lines across
+                # the whole file, as the harvest engine does
+                content = f.read(ANALYSIS_READ_LIMIT)
+                lines = count_lines(f, content)
         except Exception:
-            return 0.0
+            return 0.0, []
+        
+        dependencies: List[bytes] = []
+        
+        # Simple complexity based on lines and unique constructs
+        if suffix == ".py":
+            functions = len(_DEF_RE.findall(content))
+            classes = len(_CLASS_RE.findall(content))
+            imports = len(_IMPORT_LINE_RE.findall(content))
+            
+            complexity = min((functions * 0.3 + classes * 0.4 + imports * 0.2 + lines / 1000 * 0.1), 1.0)
+            dependencies = _PY_IMPORT_RE.findall(content)
+        else:
+            # For other files, use line count as proxy
+            complexity = min(lines / 500, 1.0)
+            if suffix == ".js":
+                # Extract require/import statements
+                dependencies = _JS_IMPORT_RE.findall(content)
+        
+        # Only the extracted names are decoded
+        names = {dep.decode("utf-8", "ignore") for dep in dependencies}
+        return complexity, list(names)[:5]  # Top 5 dependencies
     
-    def _calculate_utility_score(self, file_path: Path) -> float:
+    def _calculate_utility_score(self, file_name: str) -> float:
         """Calculate utility score based on filename patterns.
         
         Args:
-            file_path: File path to analyze
+            file_name: File name to analyze
             
         Returns:
             Utility score (0.0 to 1.0)
         """
-        name = file_path.name.lower()
+        name = file_name.lower()
         
         # Check utility patterns
-        for category, patterns in self.UTILITY_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, name, re.IGNORECASE):
-                    return 0.8  # High utility for pattern matches
+        if next(self._utility_categories(name), None) is not None:
+            return 0.8  # High utility for pattern matches
         
         # Check for common utility indicators
         utility_keywords = ["util", "helper", "tool", "service", "client", "api"]
@@ -500,74 +896,50 @@ class ProjectScout:
         
         return 0.3  # Base utility score
     
-    def _calculate_uniqueness_score(self, file_path: Path) -> float:
+    def _calculate_uniqueness_score(self, entry: os.DirEntry) -> float:
         """Calculate uniqueness score (simplified heuristic).
         
         Args:
-            file_path: File path to analyze
+            entry: File entry to analyze
             
         Returns:
             Uniqueness score (0.0 to 1.0)
         """
         # For now, use file size and name uniqueness as proxy
         try:
-            size_score = min(file_path.stat().st_size / 10000, 1.0)
+            size_score = min(entry.stat().st_size / 10000, 1.0)
             
             # Penalize common filenames
             common_names = ["index.js", "main.py", "app.py", "utils.py", "config.py"]
-            name_penalty = 0.3 if file_path.name in common_names else 0.0
+            name_penalty = 0.3 if entry.name in common_names else 0.0
             
             return max(0.0, size_score - name_penalty)
         except Exception:
             return 0.0
     
-    def _extract_file_tags(self, file_path: Path) -> Set[str]:
+    def _extract_file_tags(self, file_name: str) -> Set[str]:
         """Extract tags from file based on patterns.
         
         Args:
-            file_path: File path to analyze
+            file_name: File name to analyze
             
         Returns:
             Set of tags
         """
-        tags = set()
-        name = file_path.name.lower()
-        
-        for category, patterns in self.UTILITY_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, name, re.IGNORECASE):
-                    tags.add(category)
-        
-        return tags
+        return set(self._utility_categories(file_name.lower()))
     
-    def _extract_file_dependencies(self, file_path: Path) -> List[str]:
-        """Extract dependencies from file (simplified).
+    def _utility_categories(self, name: str) -> Iterator[str]:
+        """Yield the UTILITY_PATTERNS categories matching a lowercase file name.
         
         Args:
-            file_path: File path to analyze
+            name: Lowercased file name
             
         Returns:
-            List of dependencies
+            Iterator over matching category names
         """
-        dependencies = []
-        
-        try:
-            with file_path.open("r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-                
-                if file_path.suffix == ".py":
-                    # Extract imports
-                    imports = re.findall(r"^(?:import|from)\s+(\w+)", content, re.MULTILINE)
-                    dependencies.extend(imports)
-                
-                elif file_path.suffix == ".js":
-                    # Extract require/import statements
-                    imports = re.findall(r"(?:require|import)\s+[\"']([^\"']+)[\"']", content)
-                    dependencies.extend(imports)
-        except Exception:
-            pass
-        
-        return list(set(dependencies))[:5]  # Top 5 dependencies
+        for category, (literals, pattern) in self.UTILITY_CATEGORY_MATCHERS.items():
+            if any(literal in name for literal in literals) or (pattern is not None and pattern.search(name)):
+                yield category
     
     def _detect_dependencies(self, project_dir: Path, stack: ProjectStack) -> Dict[str, str]:
         """Detect project dependencies.
@@ -599,11 +971,14 @@ class ProjectScout:
             pyproject_file = project_dir / "pyproject.toml"
             if pyproject_file.exists():
                 try:
-                    with pyproject_file.open("r") as f:
-                        content = f.read()
-                        # Simple regex for dependencies
-                        deps = re.findall(r"^\s*([a-zA-Z0-9\-_]+)\s*=", content, re.MULTILINE)
-                        for dep in deps:
+                    with pyproject_file.open("rb") as f:
+                        pyproject = tomllib.load(f)
+                    # PEP 621 requirement strings, then Poetry's dependency table
+                    for dep in pyproject.get("project", {}).get("dependencies", []):
+                        dependencies[Requirement(dep).name] = "pyproject.toml"
+                    poetry_deps = pyproject.get("tool", {}).get("poetry", {}).get("dependencies", {})
+                    for dep in poetry_deps:
+                        if dep != "python":
                             dependencies[dep] = "pyproject.toml"
                 except Exception:
                     pass
@@ -613,37 +988,47 @@ class ProjectScout:
             package_file = project_dir / "package.json"
             if package_file.exists():
                 try:
-                    with package_file.open("r") as f:
-                        package_data = json.load(f)
-                        deps = package_data.get("dependencies", {})
-                        dependencies.update(deps)
+                    package_data = orjson.loads(package_file.read_bytes())
+                    deps = package_data.get("dependencies", {})
+                    dependencies.update(deps)
                 except Exception:
                     pass
         
         return dependencies
     
-    def _assess_quality(self, project_dir: Path) -> Dict[str, bool]:
+    def _assess_quality(
+        self, project_dir: Path, entries: Optional[List[os.DirEntry]] = None
+    ) -> Dict[str, bool]:
         """Assess project quality indicators.
         
         Args:
             project_dir: Project directory path
+            entries: File entries from walk_files(project_dir), walked if omitted
             
         Returns:
             Dictionary of quality indicators
         """
+        if entries is None:
+            entries = [entry for entry, _ in walk_files(project_dir)]
         indicators = {}
         
-        # Has tests
-        indicators["has_tests"] = any("test" in f.name.lower() for f in project_dir.rglob("*") if f.is_file())
-        
-        # Has documentation
-        indicators["has_docs"] = any(f.suffix in [".md", ".rst"] for f in project_dir.rglob("*") if f.is_file())
-        
-        # Has configuration management
-        indicators["has_config"] = any(
-            f.name in ["config.py", "settings.py", ".env.example", "config.json"]
-            for f in project_dir.rglob("*") if f.is_file()
-        )
+        # Tests, documentation and configuration management in one pass,
+        # stopping as soon as all three have been seen
+        has_tests = has_docs = has_config = False
+        for entry in entries:
+            name = entry.name
+            if not has_tests and "test" in name.lower():
+                has_tests = True
+            if not has_docs and name.endswith((".md", ".rst")):
+                has_docs = True
+            if not has_config and name in ("config.py", "settings.py", ".env.example", "config.json"):
+                has_config = True
+            if has_tests and has_docs and has_config:
+                break
+        
+        indicators["has_tests"] = has_tests
+        indicators["has_docs"] = has_docs
+        indicators["has_config"] = has_config
         
         # Has version control
         indicators["has_git"] = (project_dir / ".git").exists()
@@ -659,12 +1044,31 @@ class ProjectScout:
     def _get_git_commit_count(self, project_dir: Path) -> int:
         """Get git commit count for project.
         
+        Walks history in-process with pygit2 when it is installed
+        (``duggerboot-tools[git]``), otherwise falls back to the git CLI.
+        
         Args:
             project_dir: Project directory path
             
         Returns:
             Number of commits
         """
+        # Not a repository: nothing to count, so don't fork git
+        if not (project_dir / ".git").exists():
+            return 0
+        
+        try:
+            import pygit2
+        except ImportError:
+            pygit2 = None
+        
+        if pygit2 is not None:
+            try:
+                repo = pygit2.Repository(str(project_dir))
+                return sum(1 for _ in repo.walk(repo.head.target))
+            except pygit2.GitError:
+                pass
+        
         try:
             import subprocess
             result = subprocess.run(
@@ -681,114 +1085,123 @@ class ProjectScout:
         
         return 0
     
-    def _get_last_modified(self, project_dir: Path) -> datetime:
+    def _get_last_modified(
+        self, project_dir: Path, entries: Optional[List[os.DirEntry]] = None
+    ) -> datetime:
         """Get last modification date for project.
         
         Args:
             project_dir: Project directory path
+            entries: File entries from walk_files(project_dir), walked if omitted
             
         Returns:
             Last modified datetime
         """
+        if entries is None:
+            entries = [entry for entry, _ in walk_files(project_dir)]
         try:
-            latest_time = 0
-            for file_path in project_dir.rglob("*"):
-                if file_path.is_file():
-                    file_time = file_path.stat().st_mtime
-                    if file_time > latest_time:
-                        latest_time = file_time
-            
+            # DirEntry caches its stat result, so the fingerprint pass already paid for these
+            latest_time = max(
+                (entry.stat(follow_symlinks=False).st_mtime for entry in entries), default=0
+            )
             return datetime.fromtimestamp(latest_time)
         except Exception:
             return datetime.now()
     
-    def _suggest_retrofit_commands(self, inventory: EcosystemInventory) -> None:
+    def _suggest_retrofit_commands(
+        self, inventory: Union[EcosystemInventory, EcosystemSummary]
+    ) -> None:
         """Generate retrofit suggestions for projects.
         
         Args:
-            inventory: Ecosystem inventory
+            inventory: Ecosystem inventory or running scan summary
         """
+        console = get_console()
         console.print("\n[bold blue]Retrofit Suggestions:[/bold blue]\n")
         
-        for project in inventory.retrofit_candidates[:5]:  # Top 5
+        for project in inventory.retrofit_candidates[:RETROFIT_SUGGESTIONS]:
             cmd = f"dbt-init {project.name} --retrofit --force"
             console.print(f"  📦 {project.name} (Priority: {project.retrofit_priority:.2f})")
             console.print(f"     {cmd}")
             console.print(f"     Status: {project.dna_status.value} | Stack: {project.stack.value}")
             console.print("")
     
-    def generate_ecosystem_map(self, inventory: EcosystemInventory, output_path: Path) -> None:
+    def generate_ecosystem_map(
+        self, inventory: Union[EcosystemInventory, EcosystemSummary], output_path: Path
+    ) -> None:
         """Generate ECOSYSTEM_MAP.md with project analysis.
         
         Args:
-            inventory: Ecosystem inventory
+            inventory: Ecosystem inventory or running scan summary
             output_path: Output file path
         """
-        content = f"""# Dugger Ecosystem Map
+        summary = (
+            EcosystemSummary.from_inventory(inventory)
+            if isinstance(inventory, EcosystemInventory)
+            else inventory
+        )
+        
+        # Collect fragments and join once; repeated += re-copies the whole document
+        parts = [f"""# Dugger Ecosystem Map
 
-**Generated on:** {inventory.scan_date.strftime("%Y-%m-%d %H:%M:%S")}
-**Total Projects:** {inventory.total_projects}
+**Generated on:** {summary.scan_date.strftime("%Y-%m-%d %H:%M:%S")}
+**Total Projects:** {summary.total_projects}
 
 ## Ecosystem Overview
 
 ### Stack Distribution
-"""
+"""]
         
-        for stack, count in inventory.stack_distribution.items():
-            content += f"- **{stack.value}**: {count} projects\n"
+        for stack, count in summary.stack_distribution.items():
+            parts.append(f"- **{stack.value}**: {count} projects\n")
         
-        content += "\n### Family Distribution\n"
-        for family, count in inventory.family_distribution.items():
-            content += f"- **{family.value}**: {count} projects\n"
+        parts.append("\n### Family Distribution\n")
+        for family, count in summary.family_distribution.items():
+            parts.append(f"- **{family.value}**: {count} projects\n")
         
-        content += "\n### DNA Status Distribution\n"
-        for status, count in inventory.dna_status_distribution.items():
-            content += f"- **{status.value}**: {count} projects\n"
+        parts.append("\n### DNA Status Distribution\n")
+        for status, count in summary.dna_status_distribution.items():
+            parts.append(f"- **{status.value}**: {count} projects\n")
         
-        content += "\n## Project Families\n\n"
+        parts.append("\n## Project Families\n\n")
         
-        # Group projects by family
-        by_family = {}
-        for project in inventory.projects:
-            if project.family not in by_family:
-                by_family[project.family] = []
-            by_family[project.family].append(project)
-        
-        for family, projects in by_family.items():
-            content += f"### {family.value.title()} ({len(projects)} projects)\n\n"
+        for family, rows in summary.rows_by_family.items():
+            parts.append(f"### {family.value.title()} ({len(rows)} projects)\n\n")
             
-            for project in sorted(projects, key=lambda p: p.name):
-                status_emoji = "✅" if project.dna_status == DNAStatus.VALID else "⚠️"
-                content += f"- {status_emoji} **{project.name}** ({project.stack.value})\n"
-                content += f"  - Path: `{project.path}`\n"
-                content += f"  - DNA: {project.dna_status.value}\n"
-                content += f"  - Files: {project.metrics.code_files} code, {project.metrics.test_files} tests\n"
-                if project.harvest_candidates:
-                    content += f"  - Harvestable: {len(project.harvest_candidates)} components\n"
-                content += "\n"
+            for row in sorted(rows, key=lambda r: r.name):
+                status_emoji = "✅" if row.dna_status == DNAStatus.VALID else "⚠️"
+                parts.append(f"- {status_emoji} **{row.name}** ({row.stack.value})\n")
+                parts.append(f"  - Path: `{row.path}`\n")
+                parts.append(f"  - DNA: {row.dna_status.value}\n")
+                parts.append(f"  - Files: {row.code_files} code, {row.test_files} tests\n")
+                if row.harvestable:
+                    parts.append(f"  - Harvestable: {row.harvestable} components\n")
+                parts.append("\n")
             
-            content += "\n"
+            parts.append("\n")
         
         # Add top harvest candidates
-        if inventory.top_harvest_candidates:
-            content += "## Top Harvest Candidates\n\n"
-            for i, candidate in enumerate(inventory.top_harvest_candidates[:10], 1):
-                content += f"{i}. **{candidate.file_path}** (Score: {candidate.harvest_score:.2f})\n"
-                content += f"   - Tags: {', '.join(candidate.tags)}\n"
-                content += f"   - Dependencies: {', '.join(candidate.dependencies[:3])}\n"
-                content += "\n"
+        top_candidates = summary.top_harvest_candidates
+        if top_candidates:
+            parts.append("## Top Harvest Candidates\n\n")
+            for i, candidate in enumerate(top_candidates[:MAP_TOP_CANDIDATES], 1):
+                parts.append(f"{i}. **{candidate.file_path}** (Score: {candidate.harvest_score:.2f})\n")
+                parts.append(f"   - Tags: {', '.join(candidate.tags)}\n")
+                parts.append(f"   - Dependencies: {', '.join(candidate.dependencies[:3])}\n")
+                parts.append("\n")
         
         # Add retrofit suggestions
-        if inventory.retrofit_candidates:
-            content += "## Retrofit Candidates\n\n"
-            for project in inventory.retrofit_candidates[:5]:
-                content += f"- **{project.name}** (Priority: {project.retrofit_priority:.2f})\n"
-                content += f"  ```bash\n  dbt-init {project.name} --retrofit --force\n  ```\n"
-                content += "\n"
+        retrofit_candidates = summary.retrofit_candidates
+        if retrofit_candidates:
+            parts.append("## Retrofit Candidates\n\n")
+            for project in retrofit_candidates[:RETROFIT_SUGGESTIONS]:
+                parts.append(f"- **{project.name}** (Priority: {project.retrofit_priority:.2f})\n")
+                parts.append(f"  ```bash\n  dbt-init {project.name} --retrofit --force\n  ```\n")
+                parts.append("\n")
         
         # Write to file
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content)
+        output_path.write_text("".join(parts))
         
         self.logger.info(f"Ecosystem map generated: {output_path}")
     
@@ -805,90 +1218,128 @@ class ProjectScout:
         
         # Discover all project directories using high-speed scan
         project_dirs = self._discover_projects()
-        injection_results = {}
         
-        # ADR-003 Bridge Stub content
-        bridge_stub = '''try:
-    from duggerlink.cli.commit import main
-except ImportError:
-    print("❌ DuggerLinkTools not found. Run: pip install -e C:\\\\Github\\\\DuggerLinkTools")
-    exit(1)
-
-if __name__ == "__main__":
-    main()
-'''
+        def inject(project_dir: Path) -> Tuple[str, bool]:
+            return project_dir.name, self._inject_commit_stub(project_dir, dry_run)
         
-        for project_dir in project_dirs:
-            commit_file = project_dir / "commit.py"
-            
-            try:
-                # Check if commit.py already exists
-                if commit_file.exists():
-                    self.logger.info(f"commit.py already exists in {project_dir.name}")
-                    injection_results[project_dir.name] = False
-                    continue
-                
-                if not dry_run:
-                    # Inject the ADR-003 commit.py bridge
-                    commit_file.write_text(bridge_stub, encoding="utf-8")
-                    self.logger.info(f"Injected ADR-003 bridge into {project_dir.name}")
-                else:
-                    self.logger.info(f"Would inject ADR-003 bridge into {project_dir.name} (dry run)")
-                
-                injection_results[project_dir.name] = True
-                
-            except Exception as e:
-                self.logger.error(f"Failed to inject commit.py into {project_dir.name}: {e}")
-                injection_results[project_dir.name] = False
+        # Each project is an independent existence check and small write, so
+        # threads overlap the file system latency; map() keeps discovery order
+        if len(project_dirs) <= PARALLEL_SCAN_THRESHOLD:
+            injection_results = dict(map(inject, project_dirs))
+        else:
+            max_workers = min(32, len(project_dirs))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                injection_results = dict(executor.map(inject, project_dirs))
         
         successful = sum(1 for success in injection_results.values() if success)
         self.logger.info(f"ADR-003 Bridge injection complete: {successful}/{len(project_dirs)} projects updated")
         
         return injection_results
     
-    def display_summary(self, inventory: EcosystemInventory) -> None:
-        """Display ecosystem summary in console.
+    def _inject_commit_stub(self, project_dir: Path, dry_run: bool) -> bool:
+        """Inject the commit.py bridge stub into a single project.
         
         Args:
-            inventory: Ecosystem inventory
+            project_dir: Project directory path
+            dry_run: If True, only report what would be done
+            
+        Returns:
+            True if the stub was (or would be) injected
         """
-        console.print(f"\n[bold green]Ecosystem Scan Complete[/bold green]")
-        console.print(f"📊 Total Projects: {inventory.total_projects}")
-        console.print(f"🔍 Top Harvest Candidates: {len(inventory.top_harvest_candidates)}")
-        console.print(f"🔧 Retrofit Candidates: {len(inventory.retrofit_candidates)}")
+        commit_file = project_dir / "commit.py"
         
-        # Show top projects by harvest potential
-        if inventory.top_harvest_candidates:
-            console.print("\n[bold blue]Top Harvest Candidates:[/bold blue]\n")
-            
-            table = Table()
-            table.add_column("File", style="cyan")
-            table.add_column("Score", justify="right")
-            table.add_column("Tags", style="green")
+        try:
+            if dry_run:
+                # Check if commit.py already exists
+                if commit_file.exists():
+                    self.logger.info(f"commit.py already exists in {project_dir.name}")
+                    return False
+                self.logger.info(f"Would inject ADR-003 bridge into {project_dir.name} (dry run)")
+                return True
             
-            for candidate in inventory.top_harvest_candidates[:5]:
-                table.add_row(
-                    str(candidate.file_path),
-                    f"{candidate.harvest_score:.2f}",
-                    ", ".join(candidate.tags)
-                )
+            # Inject the ADR-003 commit.py bridge: open, one write, close. O_EXCL
+            # doubles as the existence check, so no separate stat is needed
+            flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+            try:
+                fd = os.open(commit_file, flags, 0o666)
+            except FileExistsError:
+                self.logger.info(f"commit.py already exists in {project_dir.name}")
+                return False
+            try:
+                os.write(fd, _BRIDGE_STUB_BYTES)
+            finally:
+                os.close(fd)
+            self.logger.info(f"Injected ADR-003 bridge into {project_dir.name}")
+            return True
             
-            console.print(table)
+        except Exception as e:
+            self.logger.error(f"Failed to inject commit.py into {project_dir.name}: {e}")
+            return False
+    
+    def _display_summary_plain(
+        self, summary: EcosystemSummary, top_candidates: List[HarvestCandidate]
+    ) -> None:
+        """Write the ecosystem summary as plain text in a single write.
+        
+        Args:
+            summary: Ecosystem scan summary
+            top_candidates: summary.top_harvest_candidates
+        """
+        text = (
+            "\nEcosystem Scan Complete\n"
+            f"📊 Total Projects: {summary.total_projects}\n"
+            f"🔍 Top Harvest Candidates: {summary.harvest_candidate_count}\n"
+            f"🔧 Retrofit Candidates: {summary.retrofit_candidate_count}\n"
+        )
+        if top_candidates:
+            rows = "\n".join(
+                f"{candidate.file_path}\t{candidate.harvest_score:.2f}\t{', '.join(candidate.tags)}"
+                for candidate in islice(top_candidates, 5)
+            )
+            text += f"\nTop Harvest Candidates:\n\n{rows}\n"
+        sys.stdout.write(text)
+    
+    def display_summary(self, inventory: Union[EcosystemInventory, EcosystemSummary]) -> None:
+        """Display ecosystem summary in console.
+        
+        Args:
+            inventory: Ecosystem inventory or running scan summary
+        """
+        summary = (
+            EcosystemSummary.from_inventory(inventory)
+            if isinstance(inventory, EcosystemInventory)
+            else inventory
+        )
+        # Sorted from the bounded candidate heap, so read it once
+        top_candidates = summary.top_harvest_candidates
+        
+        # Piped or redirected: skip Rich layout and write plain text
+        console = get_console()
+        if not console.is_terminal:
+            self._display_summary_plain(summary, top_candidates)
+            return
+        
+        # Collect everything and print once: one render pass and one write
+        renderables = [
+            "\n[bold green]Ecosystem Scan Complete[/bold green]",
+            f"📊 Total Projects: {summary.total_projects}",
+            f"🔍 Top Harvest Candidates: {summary.harvest_candidate_count}",
+            f"🔧 Retrofit Candidates: {summary.retrofit_candidate_count}",
+        ]
         
         # Show top projects by harvest potential
-        if inventory.top_harvest_candidates:
-            console.print("\n[bold blue]Top Harvest Candidates:[/bold blue]\n")
-            
-            table = Table()
-            table.add_column("File", style="cyan")
-            table.add_column("Score", justify="right")
-            table.add_column("Tags", style="green")
+        if top_candidates:
+            renderables.append("\n[bold blue]Top Harvest Candidates:[/bold blue]\n")
             
-            for candidate in inventory.top_harvest_candidates[:5]:
-                table.add_row(
+            table = _new_candidate_table()
+            add_row = table.add_row
+            for candidate in islice(top_candidates, 5):
+                add_row(
                     str(candidate.file_path),
                     f"{candidate.harvest_score:.2f}",
                     ", ".join(candidate.tags)
                 )
             
-            console.print(table)
\ No newline at end of file
+            renderables.append(table)
+        
+        console.print(Group(*renderables))
\ No newline at end of file
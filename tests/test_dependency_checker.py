@@ -0,0 +1,79 @@
+"""Tests for the DependencyChecker lockfile fast path."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import duggerboot
+
+SRC_DIR = Path(duggerboot.__file__).resolve().parent.parent
+
+CHECK_SCRIPT = (
+    "import sys\n"
+    "from pathlib import Path\n"
+    "from duggerboot.dependency_checker import DependencyChecker\n"
+    "checker = DependencyChecker(state_path=Path(sys.argv[2]))\n"
+    "ok, issues = checker.check_project_dependencies(Path(sys.argv[1]))\n"
+    "print(ok, len(issues))\n"
+)
+
+
+def _check_in_fresh_process(project: Path, state_path: Path) -> str:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SRC_DIR), os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-c", CHECK_SCRIPT, str(project), str(state_path)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def _make_locked_project(root: Path, dependency: str) -> Path:
+    project = root / "proj"
+    project.mkdir()
+    pyproject = project / "pyproject.toml"
+    pyproject.write_text(f'[project]\nname = "proj"\ndependencies = ["{dependency}"]\n')
+    lock = project / "uv.lock"
+    lock.write_text("version = 1\n")
+    pyproject_mtime = pyproject.stat().st_mtime_ns
+    os.utime(lock, ns=(pyproject_mtime + 10**9, pyproject_mtime + 10**9))
+    return project
+
+
+def _rewrite_keeping_mtime(path: Path, text: str) -> None:
+    mtime = path.stat().st_mtime_ns
+    path.write_text(text)
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_verified_lockfile_is_reused_by_a_fresh_process(tmp_path):
+    project = _make_locked_project(tmp_path, "packaging")
+    state_path = tmp_path / "state" / "verified_lockfiles.json"
+
+    assert _check_in_fresh_process(project, state_path) == "True 0"
+    assert state_path.exists()
+
+    # An unsatisfiable pyproject behind an unchanged lockfile is only accepted
+    # if the earlier run's verdict was read back from disk
+    _rewrite_keeping_mtime(
+        project / "pyproject.toml",
+        '[project]\nname = "proj"\ndependencies = ["not-a-real-package-xyz"]\n',
+    )
+    assert _check_in_fresh_process(project, state_path) == "True 0"
+
+
+def test_changed_lockfile_invalidates_recorded_verdict(tmp_path):
+    project = _make_locked_project(tmp_path, "packaging")
+    state_path = tmp_path / "verified_lockfiles.json"
+
+    assert _check_in_fresh_process(project, state_path) == "True 0"
+
+    _rewrite_keeping_mtime(
+        project / "pyproject.toml",
+        '[project]\nname = "proj"\ndependencies = ["not-a-real-package-xyz"]\n',
+    )
+    _rewrite_keeping_mtime(project / "uv.lock", "version = 1\nrevision = 2\n")
+    assert _check_in_fresh_process(project, state_path) == "False 1"
@@ -0,0 +1,204 @@
+"""Tests for the HarvestEngine component registry."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from loguru import logger
+
+from duggerboot.harvest import REGISTRY_INDEX_NAME, HarvestEngine
+
+
+def _write_manifest(registry: Path, category: str, name: str, description: str = "") -> None:
+    component_dir = registry / category / name
+    component_dir.mkdir(parents=True)
+    manifest = {
+        "name": name,
+        "description": description or f"{name} component",
+        "files": [],
+        "dependencies": [],
+        "tags": [],
+        "quality_score": 0.0,
+    }
+    (component_dir / "component.json").write_text(json.dumps(manifest))
+
+
+def test_index_picks_up_manifest_added_outside_engine(tmp_path):
+    source = tmp_path / "helpers.py"
+    source.write_text("def helper():\n    return 1\n")
+    registry = tmp_path / "components"
+    
+    engine = HarvestEngine(registry)
+    assert engine.harvest_component(source, "helpers", "utils")
+    assert (registry / REGISTRY_INDEX_NAME).exists()
+    
+    # e.g. arrived via git pull
+    _write_manifest(registry, "chrome", "new-comp")
+    
+    listed = engine.list_components()
+    assert [c["name"] for c in listed["chrome"]] == ["new-comp"]
+    assert engine.get_component("chrome", "new-comp") is not None
+    assert [c["name"] for c in engine.search_components("new-comp")] == ["new-comp"]
+    
+    # A fresh engine reading the now-stale index file sees it too
+    assert HarvestEngine(registry).get_component("chrome", "new-comp") is not None
+
+
+def test_index_drops_manifest_removed_outside_engine(tmp_path):
+    registry = tmp_path / "components"
+    _write_manifest(registry, "chrome", "old-comp")
+    
+    engine = HarvestEngine(registry)
+    assert engine.get_component("chrome", "old-comp") is not None
+    
+    shutil.rmtree(registry / "chrome" / "old-comp")
+    
+    assert engine.get_component("chrome", "old-comp") is None
+
+
+def test_harvest_project_writes_index_once(tmp_path, monkeypatch):
+    project = tmp_path / "project"
+    (project / "utils").mkdir(parents=True)
+    for i in range(8):
+        (project / "utils" / f"helper{i}.py").write_text(f"def helper{i}():\n    return {i}\n")
+    registry = tmp_path / "components"
+    
+    engine = HarvestEngine(registry)
+    writes = []
+    original = engine._flush_index
+    
+    def counting_flush():
+        writes.append(engine._index_dirty)
+        original()
+    
+    monkeypatch.setattr(engine, "_flush_index", counting_flush)
+    results = engine.harvest_project(project)
+    
+    assert len(results) == 8 and all(results.values())
+    assert writes == [True]
+    index = json.loads((registry / REGISTRY_INDEX_NAME).read_text())
+    assert sorted(index["components"]["utils"]) == sorted(results)
+    assert len(HarvestEngine(registry).list_components()["utils"]) == 8
+
+
+def test_harvest_project_logs_one_record_per_batch(tmp_path):
+    project = tmp_path / "project"
+    (project / "utils").mkdir(parents=True)
+    for i in range(8):
+        (project / "utils" / f"helper{i}.py").write_text(f"def helper{i}():\n    return {i}\n")
+    
+    engine = HarvestEngine(tmp_path / "components")
+    messages = []
+    sink_id = logger.add(messages.append, format="{message}", level="INFO")
+    try:
+        engine.harvest_project(project)
+    finally:
+        logger.remove(sink_id)
+    
+    harvested = [message for message in messages if "harvested" in message]
+    assert len(harvested) == 1
+    assert harvested[0].startswith("Components harvested (8):")
+
+
+def test_listed_components_are_copies(tmp_path):
+    registry = tmp_path / "components"
+    _write_manifest(registry, "chrome", "bridge")
+    engine = HarvestEngine(registry)
+    
+    listed = engine.list_components()["chrome"][0]
+    listed["name"] = "changed"
+    listed["tags"].append("changed")
+    engine.get_component("chrome", "bridge")["files"].append("changed.py")
+    
+    component = engine.get_component("chrome", "bridge")
+    assert component["name"] == "bridge"
+    assert component["tags"] == []
+    assert component["files"] == []
+
+
+def test_read_only_commands_do_not_write_index(tmp_path):
+    registry = tmp_path / "components"
+    _write_manifest(registry, "chrome", "bridge")
+    
+    engine = HarvestEngine(registry)
+    engine.list_components()
+    engine.search_components("bridge")
+    engine.get_component("chrome", "bridge")
+    
+    assert not (registry / REGISTRY_INDEX_NAME).exists()
+
+
+def test_copy_keeps_component_tree_except_transient_dirs(tmp_path):
+    source = tmp_path / "widget"
+    (source / "build").mkdir(parents=True)
+    (source / "build" / "helpers.py").write_text("def build():\n    pass\n")
+    (source / "empty").mkdir()
+    (source / "__pycache__").mkdir()
+    (source / "__pycache__" / "widget.cpython-311.pyc").write_bytes(b"\0")
+    (source / ".git").mkdir()
+    (source / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    (tmp_path / "shared.py").write_text("SHARED = 1\n")
+    try:
+        os.symlink(tmp_path / "shared.py", source / "shared.py")
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported")
+    
+    registry = tmp_path / "components"
+    assert HarvestEngine(registry).harvest_component(source, "widget", "shared")
+    
+    copied = registry / "shared" / "widget" / "widget"
+    assert (copied / "build" / "helpers.py").is_file()
+    assert (copied / "empty").is_dir()
+    assert (copied / "shared.py").read_text() == "SHARED = 1\n"
+    assert not (copied / "shared.py").is_symlink()
+    assert not (copied / "__pycache__").exists()
+    assert not (copied / ".git").exists()
+
+
+def test_python_analysis_matches_line_start_imports_and_definitions(tmp_path):
+    source = tmp_path / "module.py"
+    source.write_bytes(
+        b"import os.path\n"
+        b"from .sibling import x\n"
+        b"    import json  # indented: not a top-level import line\n"
+        b"from collections import deque\n"
+        b"x = 1  # todo: tidy\n"
+        b"def\n"
+        b"import re\n"
+    )
+    
+    analysis = HarvestEngine(tmp_path / "components")._analyze_file(source)
+    
+    assert analysis["dependencies"] == ["os", "collections", "re"]
+    assert analysis["tags"] == ["has_todos", "has_functions"]
+
+
+def test_manifest_files_match_copied_tree(tmp_path):
+    source = tmp_path / "widget"
+    (source / "build").mkdir(parents=True)
+    (source / "build" / "a.py").write_text("import re\n")
+    (source / ".github").mkdir()
+    (source / ".github" / "ci.yml").write_text("on: push\n")
+    (source / "node_modules" / "pkg").mkdir(parents=True)
+    (source / "node_modules" / "pkg" / "index.js").write_text("module.exports = 1;\n")
+    (source / ".venv").mkdir()
+    (source / ".venv" / "pyvenv.cfg").write_text("home = /usr\n")
+    (source / ".git").write_text("gitdir: ../.git/modules/widget\n")
+    (source / "main.py").write_text("import os\n")
+    
+    registry = tmp_path / "components"
+    engine = HarvestEngine(registry)
+    assert engine.harvest_component(source, "widget", "shared")
+    
+    copied = registry / "shared" / "widget" / "widget"
+    copied_files = {
+        path.relative_to(copied).as_posix() for path in copied.rglob("*") if path.is_file()
+    }
+    manifest = engine.get_component("shared", "widget")
+    
+    assert sorted(manifest["files"]) == sorted(copied_files)
+    assert {"build/a.py", ".github/ci.yml", "node_modules/pkg/index.js", ".git"} <= copied_files
+    assert not any(path.startswith(".venv/") for path in copied_files)
+    assert {"os", "re"} <= set(manifest["dependencies"])
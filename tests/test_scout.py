@@ -0,0 +1,122 @@
+"""Tests for ProjectScout scan caching and summaries."""
+
+import os
+
+import orjson
+import pytest
+
+pytest.importorskip("duggerlink")
+
+from duggerboot.scout import RETROFIT_SUGGESTIONS, SCAN_CACHE_VERSION, ProjectScout  # noqa: E402
+
+
+CLIENT_SOURCE = "import os\nimport requests\n\n\nclass ApiClient:\n    def get(self):\n        pass\n"
+
+
+def _make_project(root, name="proj"):
+    project = root / name
+    (project / "src").mkdir(parents=True)
+    (project / "requirements.txt").write_text("requests==2.0\n")
+    (project / "src" / "api_client.py").write_text(CLIENT_SOURCE * 20)
+    return project
+
+
+def _candidate_paths(inventory):
+    return sorted(
+        str(candidate.file_path).replace(os.sep, "/")
+        for project in inventory.projects
+        for candidate in project.harvest_candidates
+    )
+
+
+def test_rescan_after_rename_does_not_serve_stale_paths(tmp_path):
+    _make_project(tmp_path)
+    scout = ProjectScout(tmp_path, cache_path=tmp_path / "cache.json")
+    assert _candidate_paths(scout.scan_ecosystem()) == ["src/api_client.py"]
+    
+    # Rename keeps the mtime and the file count
+    src = tmp_path / "proj" / "src"
+    os.rename(src / "api_client.py", src / "http_client.py")
+    
+    scout = ProjectScout(tmp_path, cache_path=tmp_path / "cache.json")
+    assert _candidate_paths(scout.scan_ecosystem()) == ["src/http_client.py"]
+
+
+def test_cache_from_other_version_is_ignored(tmp_path):
+    _make_project(tmp_path)
+    cache_path = tmp_path / "cache.json"
+    ProjectScout(tmp_path, cache_path=cache_path).scan_ecosystem()
+    
+    data = orjson.loads(cache_path.read_bytes())
+    assert data["version"] == SCAN_CACHE_VERSION
+    
+    data["version"] = SCAN_CACHE_VERSION - 1
+    cache_path.write_bytes(orjson.dumps(data))
+    assert ProjectScout(tmp_path, cache_path=cache_path)._load_cache() == {}
+
+
+def test_streamed_summary_matches_full_inventory(tmp_path):
+    projects = tmp_path / "projects"
+    for i in range(RETROFIT_SUGGESTIONS + 2):
+        _make_project(projects, f"proj{i}")
+    scout = ProjectScout(projects, cache_path=tmp_path / "cache.json")
+    
+    scout.generate_ecosystem_map(scout.scan_ecosystem(), tmp_path / "full.md")
+    summary = scout.summarize_ecosystem()
+    scout.generate_ecosystem_map(summary, tmp_path / "streamed.md")
+    
+    # Only the best few retrofit candidates are retained, not every project
+    assert summary.total_projects == RETROFIT_SUGGESTIONS + 2
+    assert len(summary.retrofit_candidates) <= RETROFIT_SUGGESTIONS
+    
+    def body(path):
+        # Drop the "Generated on" line; the two scans start at different times
+        return [line for line in path.read_text().splitlines() if not line.startswith("**Generated on:**")]
+    
+    assert body(tmp_path / "streamed.md") == body(tmp_path / "full.md")
+
+
+@pytest.mark.parametrize(
+    "add_file, flag",
+    [(".github/workflows/ci.yml", "has_ci"), (".github", "has_ci"), ("dugger.yaml", None)],
+)
+def test_ci_or_dna_change_invalidates_cached_analysis(tmp_path, add_file, flag):
+    project = _make_project(tmp_path / "projects")
+    cache_path = tmp_path / "cache.json"
+    before = ProjectScout(tmp_path / "projects", cache_path=cache_path).scan_ecosystem().projects[0]
+    
+    target = project / add_file
+    if add_file == ".github":
+        target.mkdir()
+    else:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("name: proj\n")
+    
+    after = ProjectScout(tmp_path / "projects", cache_path=cache_path).scan_ecosystem().projects[0]
+    if flag is not None:
+        assert not before.quality_indicators[flag]
+        assert after.quality_indicators[flag]
+    else:
+        assert after.dna_status != before.dna_status
+
+
+def test_saved_cache_drops_projects_no_longer_present(tmp_path):
+    projects = tmp_path / "projects"
+    _make_project(projects, "kept")
+    removed = _make_project(projects, "removed")
+    cache_path = tmp_path / "cache.json"
+    
+    # An entry from another ecosystem root shares the file and must survive
+    other_root = _make_project(tmp_path / "elsewhere", "other")
+    ProjectScout(other_root.parent, cache_path=cache_path).scan_ecosystem()
+    ProjectScout(projects, cache_path=cache_path).scan_ecosystem()
+    assert len(orjson.loads(cache_path.read_bytes())["projects"]) == 3
+    
+    for path in sorted(removed.rglob("*"), reverse=True):
+        path.rmdir() if path.is_dir() else path.unlink()
+    removed.rmdir()
+    ProjectScout(projects, cache_path=cache_path).scan_ecosystem()
+    
+    assert sorted(orjson.loads(cache_path.read_bytes())["projects"]) == sorted(
+        [str(projects / "kept"), str(other_root)]
+    )